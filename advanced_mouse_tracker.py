@@ -1,11 +1,17 @@
 import tkinter as tk
 from tkinter import ttk
+import ctypes
+from ctypes import wintypes
 import time
 import math
 import numpy as np
 import threading
 from rawInput import RawInputReader
-import queue
+from tracker_kernels import find_collisions, step_bounces, spawn_bounces, bounce_colors, trail_sprites
+from collections import deque
+
+# NumPy view of rawInput.RAWMOVEEVENT, used to read the reader's movement ring in bulk
+RAW_MOVE_DTYPE = np.dtype([('dx', np.int32), ('dy', np.int32), ('timestamp', np.uint64)])
 
 class AdvancedMouseTracker:
     def __init__(self):
@@ -32,36 +38,66 @@ class AdvancedMouseTracker:
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
         
+        # Canvas size, kept current by <Configure> so drawing never queries Tk for it
+        self.canvas_width = self.screen_width
+        self.canvas_height = self.screen_height
+        
+        # Prototype GetCursorPos once and reuse a single POINT for every query
+        self._GetCursorPos = ctypes.windll.user32.GetCursorPos
+        self._GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+        self._GetCursorPos.restype = wintypes.BOOL
+        self._cursor_point = wintypes.POINT()
+        self._cursor_point_ref = ctypes.byref(self._cursor_point)
+        
         # Mouse tracking variables (enhanced with raw input data)
         # Get initial cursor position
-        import ctypes
-        from ctypes import wintypes
-        point = wintypes.POINT()
-        ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
+        self._GetCursorPos(self._cursor_point_ref)
+        point = self._cursor_point
         
         self.current_x = point.x if 0 <= point.x <= self.screen_width else self.screen_width // 2
         self.current_y = point.y if 0 <= point.y <= self.screen_height else self.screen_height // 2
         self.raw_delta_x = 0
         self.raw_delta_y = 0
         self.movement_velocity = 0
-        self.movement_direction = 0
         
-        # Trail positions with velocity information
-        self.trail_positions = []
+        # Trail positions with velocity information (ring buffer of x, y, velocity)
+        self.max_trail_length = 30  # Increased for smoother trails
+        # Trail ring buffer as parallel x / y / velocity arrays
+        self.trail_x = np.zeros(self.max_trail_length, dtype=np.float32)
+        self.trail_y = np.zeros(self.max_trail_length, dtype=np.float32)
+        self.trail_v = np.zeros(self.max_trail_length, dtype=np.float32)
+        self._trail_order = np.tile(np.arange(self.max_trail_length), 2)  # Any oldest-to-newest run is a slice of this
+        self._trail_boxes = np.zeros((self.max_trail_length, 4), dtype=np.float64)  # Per-frame draw scratch
+        self._trail_buckets = np.zeros((self.max_trail_length, 2), dtype=np.intp)
+        self._trail_head = 0
+        self._trail_count = 0
         
         # Line history using numpy array for efficiency (enhanced for raw input)
         self.max_history_points = 5000  # Increased for raw input precision
-        self.history_points = np.zeros((self.max_history_points, 4), dtype=np.float32)  # x, y, delta_x, delta_y
+        # Screen coordinates fit in int16; raw deltas get int32 since absolute-mode devices
+        # (RDP, VMs, pen tablets) report positions up to 65535. Stored as separate columns
+        self.hist_x = np.zeros(self.max_history_points, dtype=np.int16)
+        self.hist_y = np.zeros(self.max_history_points, dtype=np.int16)
+        self.hist_dx = np.zeros(self.max_history_points, dtype=np.int32)
+        self.hist_dy = np.zeros(self.max_history_points, dtype=np.int32)
+        self._history_xy = np.zeros((self.max_history_points, 2), dtype=np.int16)  # Ordered scratch for drawing
+        self._history_d = np.zeros((self.max_history_points, 2), dtype=np.int32)
+        self.history_display_points = self.screen_width  # Roughly one drawn vertex per pixel column; updated on resize
+        self.history_bands = 16  # Polyline segments the history fades across
         self.history_count = 0
         self.history_index = 0
         
-        self.max_trail_length = 30  # Increased for smoother trails
-        
         # Animation variables
         self.grow_radius = 30
         self.grow_direction = 1
         self.pointer_radius = 15
         
+        # Velocity-keyed color strings, built once instead of formatted every frame
+        self.build_color_palettes()
+        
+        # Full redraw only when something visible changed since the last frame
+        self._dirty = True
+        
         # Control variables
         self.show_trail = True
         self.show_grow_animation = True
@@ -78,33 +114,81 @@ class AdvancedMouseTracker:
         self.pin_spacing_y = 60
         self.bounce_strength = 20
         self.collision_distance = self.pointer_radius + self.pin_radius
+        self._coll_d2 = float(self.collision_distance ** 2)
+        self._coll_reach = float(self.collision_distance)
+        
+        # Bounce timing constants in nanoseconds, plus the float radius the kernel expects
+        self._bounce_dedup_ns = 100_000_000
+        self._bounce_dur_base_ns = 300_000_000
+        self._bounce_dur_scale_ns = 200_000_000
+        self._pin_radius_f = float(self.pin_radius)
         
         # Initialize plinko pins
         self.setup_plinko_pins()
         
-        # Bounce effects for collisions
-        self.bounce_effects = []
+        # Bounce effects for collisions, stored as parallel arrays (first bounce_count live)
+        self.max_bounce_effects = 256
+        self.bounce_x = np.zeros(self.max_bounce_effects, dtype=np.float32)
+        self.bounce_y = np.zeros(self.max_bounce_effects, dtype=np.float32)
+        self.bounce_start = np.zeros(self.max_bounce_effects, dtype=np.int64)  # perf_counter_ns
+        self.bounce_duration = np.zeros(self.max_bounce_effects, dtype=np.int64)  # nanoseconds
+        self.bounce_max_radius = np.zeros(self.max_bounce_effects, dtype=np.float32)
+        self.bounce_radius = np.zeros(self.max_bounce_effects, dtype=np.float32)
+        self.bounce_color_intensity = np.zeros(self.max_bounce_effects, dtype=np.int32)
+        self.bounce_velocity = np.zeros(self.max_bounce_effects, dtype=np.float32)
+        self.bounce_pin = np.zeros(self.max_bounce_effects, dtype=np.intp)  # Index of the pin that was hit
+        self.bounce_count = 0
+        self._bounce_rgb = np.zeros((self.max_bounce_effects, 3), dtype=np.int32)  # Per-frame draw scratch
+        self._bounce_rings = np.zeros(self.max_bounce_effects, dtype=np.int32)
+        
+        # Persistent canvas items, moved and recolored in place every frame
+        self.create_canvas_items()
         
         # Raw input statistics
         self.total_mouse_movements = 0
         self.total_raw_distance = 0
-        self.max_velocity = 0
+        self.max_v2 = 0  # Squared peak velocity; square root taken only for display
         self.click_count = 0
         self.wheel_delta = 0
         self.movement_count = 0  # For debugging
         
+        # Active click / wheel effects (None when idle)
+        self.click_effect = None
+        self.wheel_effect = None
+        
         # Raw input status tracking
         self.raw_input_active = False
-        self.last_raw_input_time = 0
+        self.last_raw_input_time = 0  # perf_counter_ns of the last raw batch
+        self.raw_input_timeout_ns = 100_000_000  # Raw input counts as live for 100ms
+        
+        # Monotonic nanosecond clock for all age checks
+        self._clock = time.perf_counter_ns
+        
+        # Frames are scheduled against fixed deadlines rather than a fixed delay
+        self.frame_interval_ns = 16_000_000  # ~60 FPS
+        self._next_frame_ns = self._clock()
         
         # Initialize raw input reader
         self.raw_input_reader = RawInputReader()
-        self.input_queue = queue.Queue()
+        self.input_queue = deque()  # append/popleft are atomic, no lock needed for one producer/consumer
         self.raw_input_thread = None
         
+        # Each frame drains up to max_batch_moves mouse deltas into one scratch batch
+        self.max_batch_moves = 1024
+        self._batch_moves = np.zeros((self.max_batch_moves, 2), dtype=np.int32)
+        
+        # The reader publishes movement into a shared ctypes ring (single producer,
+        # single consumer, no lock); read it through a NumPy view
+        self.raw_input_reader.enable_move_ring(4 * self.max_batch_moves)
+        self._move_ring = np.frombuffer(self.raw_input_reader.move_ring, dtype=RAW_MOVE_DTYPE)
+        
         # Create modern UI elements
+        self.stats_label = None
         self.create_modern_ui()
         
+        # Widgets lifted above the canvas every frame
+        self._ui_elements = (self.reset_button, self.controls_frame, self.exit_button, self.stats_label)
+        
         # Bind events
         self.root.bind('<Motion>', self.on_mouse_move)  # Fallback mouse tracking
         self.canvas.bind('<Motion>', self.on_mouse_move)  # Also bind to canvas
@@ -147,14 +231,10 @@ class AdvancedMouseTracker:
         
     def start_raw_input(self):
         """Start the raw input reader in a separate thread"""
-        def raw_input_callback(data):
-            """Callback to handle raw input data"""
-            self.input_queue.put(data)
-            
         def raw_input_worker():
             """Worker thread for raw input processing"""
             try:
-                self.raw_input_reader.set_callback(raw_input_callback)
+                self.raw_input_reader.set_callback(self.on_raw_input)
                 self.raw_input_reader.register_devices()
                 self.raw_input_reader.start_message_loop() # type: ignore
             except Exception as e:
@@ -166,82 +246,103 @@ class AdvancedMouseTracker:
         print("🚀 Advanced Mouse Tracker with Raw Input started!")
         print("   Enhanced precision with Windows Raw Input API")
         
+    def on_raw_input(self, data):
+        """Raw input thread callback: queue button/wheel/key events (movement arrives via the move ring)"""
+        self.input_queue.append(data)
+            
     def process_raw_input_data(self):
-        """Process queued raw input data"""
-        try:
-            while not self.input_queue.empty():
-                data = self.input_queue.get_nowait()
+        """Process this frame's accumulated mouse deltas in one batch, then queued button/wheel/key events"""
+        # Copy everything the reader published to its movement ring since last frame
+        moves = self._batch_moves
+        move_count = self.drain_move_ring(moves, 0)
+            
+        if move_count:
+            self.handle_raw_mouse_batch(moves[:move_count])
+            
+        input_queue = self.input_queue
+        while input_queue:
+            data = input_queue.popleft()
+            
+            if data['type'] == 'mouse_button':
+                self.handle_raw_mouse_button(data)
+            elif data['type'] == 'mouse_wheel':
+                self.handle_raw_mouse_wheel(data)
+            elif data['type'] == 'keyboard':
+                self.handle_raw_keyboard(data)
                 
-                if data['type'] == 'mouse_move':
-                    self.handle_raw_mouse_movement(data)
-                elif data['type'] == 'mouse_button':
-                    self.handle_raw_mouse_button(data)
-                elif data['type'] == 'mouse_wheel':
-                    self.handle_raw_mouse_wheel(data)
-                elif data['type'] == 'keyboard':
-                    self.handle_raw_keyboard(data)
-                    
-        except queue.Empty:
-            pass
+    def drain_move_ring(self, moves, move_count):
+        """Copy samples published in the reader's movement ring into moves, return the new count"""
+        reader = self.raw_input_reader
+        tail = reader.move_ring_tail
+        available = min(reader.move_ring_head - tail, self.max_batch_moves - move_count)
+        if available <= 0:
+            return move_count
             
-    def handle_raw_mouse_movement(self, data):
-        """Handle raw mouse movement data with enhanced precision"""
+        # Copy at most two contiguous runs (before and after the wrap point)
+        ring = self._move_ring
+        start = tail % reader.move_ring_size
+        first = min(available, reader.move_ring_size - start)
+        end = move_count + first
+        moves[move_count:end, 0] = ring['dx'][start:start + first]
+        moves[move_count:end, 1] = ring['dy'][start:start + first]
+        rest = available - first
+        if rest:
+            moves[end:end + rest, 0] = ring['dx'][:rest]
+            moves[end:end + rest, 1] = ring['dy'][:rest]
+            
+        # Release the slots back to the reader
+        reader.move_ring_tail = tail + available
+        return move_count + available
+        
+    def handle_raw_mouse_batch(self, deltas):
+        """Handle a frame's worth of raw mouse deltas with vectorized velocity math"""
         # Mark raw input as active
         self.raw_input_active = True
-        self.last_raw_input_time = time.time()
+        self.last_raw_input_time = self._clock()
         
-        # Get raw deltas
-        self.raw_delta_x = data['delta_x']
-        self.raw_delta_y = data['delta_y']
-        
-        # Calculate movement velocity and direction
-        velocity = math.sqrt(self.raw_delta_x**2 + self.raw_delta_y**2)
-        self.movement_velocity = velocity
+        # Magnitudes for every sample in the batch in one pass
+        dx = deltas[:, 0]
+        dy = deltas[:, 1]
+        speeds = np.hypot(dx, dy)
         
-        if velocity > 0:
-            self.movement_direction = math.atan2(self.raw_delta_y, self.raw_delta_x)
-            
-        # Update max velocity tracking
-        if velocity > self.max_velocity:
-            self.max_velocity = velocity
-            
         # Update total statistics
-        self.total_mouse_movements += 1
-        self.total_raw_distance += velocity
+        self.total_mouse_movements += len(deltas)
+        self.total_raw_distance += float(speeds.sum())
+        peak_velocity = float(speeds.max())
+        peak_v2 = peak_velocity * peak_velocity
+        if peak_v2 > self.max_v2:
+            self.max_v2 = peak_v2
+        
+        # The most recent sample drives the live deltas and velocity
+        self.raw_delta_x = int(dx[-1])
+        self.raw_delta_y = int(dy[-1])
+        velocity = float(speeds[-1])
+        self.movement_velocity = velocity
         
-        # Get actual cursor position (more reliable than raw deltas for absolute position)
-        import ctypes
-        from ctypes import wintypes
-        point = wintypes.POINT()
-        ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
+        # Get actual cursor position once per frame (more reliable than raw deltas for absolute position)
+        self._GetCursorPos(self._cursor_point_ref)
         
         # Update current position
-        self.current_x = point.x
-        self.current_y = point.y
+        self.current_x = self._cursor_point.x
+        self.current_y = self._cursor_point.y
         
         # Ensure coordinates are within screen bounds
         self.current_x = max(0, min(self.current_x, self.screen_width))
         self.current_y = max(0, min(self.current_y, self.screen_height))
         
-        # Check for plinko pin collisions with velocity-based effects
+        # Check for plinko pin collisions, letting the batch's fastest sample drive the bounce
         if self.show_plinko:
-            self.check_plinko_collisions_with_velocity(self.current_x, self.current_y, velocity)
+            self.check_plinko_collisions_with_velocity(self.current_x, self.current_y, peak_velocity)
         
         # Store current position in history array with raw input data
         if self.show_line_history:
-            self.history_points[self.history_index] = [
-                self.current_x, self.current_y, 
-                self.raw_delta_x, self.raw_delta_y
-            ]
-            self.history_index = (self.history_index + 1) % self.max_history_points
-            if self.history_count < self.max_history_points:
-                self.history_count += 1
+            self.add_history_point(self.current_x, self.current_y, self.raw_delta_x, self.raw_delta_y)
         
         # Add to trail with velocity information
         if self.show_trail:
-            self.trail_positions.append((self.current_x, self.current_y, velocity))
-            if len(self.trail_positions) > self.max_trail_length:
-                self.trail_positions.pop(0)
+            self.add_trail_point(self.current_x, self.current_y, velocity)
+            
+        self._dirty = True
                 
     def handle_raw_mouse_button(self, data):
         """Handle raw mouse button events"""
@@ -256,6 +357,7 @@ class AdvancedMouseTracker:
                 'button': data['button'],
                 'max_radius': 50
             }
+            self._dirty = True
             
     def handle_raw_mouse_wheel(self, data):
         """Handle raw mouse wheel events"""
@@ -267,6 +369,7 @@ class AdvancedMouseTracker:
             'delta': data['delta'],
             'lifetime': 20
         }
+        self._dirty = True
         
     def handle_raw_keyboard(self, data):
         """Handle raw keyboard events for enhanced shortcuts"""
@@ -279,43 +382,25 @@ class AdvancedMouseTracker:
         if len(self.plinko_pins) == 0:
             return
             
-        # Calculate distances to all pins using numpy
-        distances = np.sqrt(np.sum((self.plinko_pins - [x, y]) ** 2, axis=1))
-        
-        # Find pins within collision distance
-        collision_indices = np.where(distances <= self.collision_distance)[0]
-        
-        for idx in collision_indices:
-            pin_x, pin_y = self.plinko_pins[idx]
-            
-            # Create velocity-enhanced bounce effect
-            self.create_velocity_bounce_effect(pin_x, pin_y, velocity)
+        # Grid broadphase and squared-distance narrowphase in one kernel call, no allocation
+        hits = find_collisions(
+            self.pins_x, self.pins_y, self.pin_grid_order, self.pin_grid_start,
+            self.pin_grid_w, self.pin_grid_h, self.pin_grid_cell,
+            float(x), float(y), self._coll_reach, self._coll_d2, self._collision_out
+        )
+        if hits:
+            self.create_velocity_bounce_effects(hits, velocity)
             
-    def create_velocity_bounce_effect(self, pin_x, pin_y, velocity):
-        """Create velocity-enhanced bounce effect"""
-        current_time = time.time()
-        
-        # Check for recent effects at this location
-        for effect in self.bounce_effects:
-            if (abs(effect['x'] - pin_x) < 10 and 
-                abs(effect['y'] - pin_y) < 10 and 
-                current_time - effect['start_time'] < 0.1):
-                return
-        
-        # Velocity affects bounce intensity
-        velocity_factor = min(velocity / 50.0, 3.0)  # Cap at 3x effect
-        
-        bounce_effect = {
-            'x': pin_x,
-            'y': pin_y,
-            'radius': self.pin_radius,
-            'max_radius': self.pin_radius * (2 + velocity_factor),
-            'start_time': current_time,
-            'duration': 0.3 + (velocity_factor * 0.2),
-            'color_intensity': min(255, 150 + int(velocity * 2)),
-            'velocity': velocity
-        }
-        self.bounce_effects.append(bounce_effect)
+    def create_velocity_bounce_effects(self, hits, velocity):
+        """Create velocity-enhanced bounce effects for the first `hits` pins in the collision buffer"""
+        # Dedup against recent effects and fill the bounce arrays in one compiled pass
+        self.bounce_count = spawn_bounces(
+            self._collision_out, hits, self.pins_x, self.pins_y, float(velocity), self._clock(),
+            self.bounce_x, self.bounce_y, self.bounce_start, self.bounce_duration,
+            self.bounce_max_radius, self.bounce_radius, self.bounce_color_intensity,
+            self.bounce_velocity, self.bounce_pin, self.bounce_count,
+            self._pin_radius_f, self._bounce_dedup_ns, self._bounce_dur_base_ns, self._bounce_dur_scale_ns
+        )
         
     def create_modern_ui(self):
         """Create modern UI elements with enhanced controls"""
@@ -496,6 +581,7 @@ class AdvancedMouseTracker:
     def toggle_velocity_info(self):
         """Toggle velocity information display"""
         self.show_velocity_info = not self.show_velocity_info
+        self._dirty = True
         self.velocity_button.config(
             text=f"Velocity: {'ON' if self.show_velocity_info else 'OFF'} (V)",
             bg='#2ed573' if self.show_velocity_info else '#ff4757'
@@ -504,6 +590,7 @@ class AdvancedMouseTracker:
     def toggle_raw_delta(self):
         """Toggle raw delta information display"""
         self.show_raw_delta = not self.show_raw_delta
+        self._dirty = True
         self.raw_delta_button.config(
             text=f"Raw: {'ON' if self.show_raw_delta else 'OFF'} (R)",
             bg='#2ed573' if self.show_raw_delta else '#ff4757'
@@ -524,15 +611,17 @@ class AdvancedMouseTracker:
     # Include all other toggle methods from the original
     def toggle_trail(self):
         self.show_trail = not self.show_trail
+        self._dirty = True
         self.trail_button.config(
             text=f"Trail: {'ON' if self.show_trail else 'OFF'} (T)",
             bg='#2ed573' if self.show_trail else '#ff4757'
         )
         if not self.show_trail:
-            self.trail_positions.clear()
+            self.reset_trail()
             
     def toggle_grow(self):
         self.show_grow_animation = not self.show_grow_animation
+        self._dirty = True
         self.grow_button.config(
             text=f"Grow: {'ON' if self.show_grow_animation else 'OFF'} (G)",
             bg='#2ed573' if self.show_grow_animation else '#ff4757'
@@ -540,6 +629,7 @@ class AdvancedMouseTracker:
         
     def toggle_history(self):
         self.show_line_history = not self.show_line_history
+        self._dirty = True
         self.history_button.config(
             text=f"Lines: {'ON' if self.show_line_history else 'OFF'} (L)",
             bg='#2ed573' if self.show_line_history else '#ff4757'
@@ -559,15 +649,19 @@ class AdvancedMouseTracker:
             
     def toggle_plinko(self):
         self.show_plinko = not self.show_plinko
+        self._dirty = True
         self.plinko_button.config(
             text=f"Plinko: {'ON' if self.show_plinko else 'OFF'} (P)",
             bg='#2ed573' if self.show_plinko else '#ff4757'
         )
+        self.canvas.itemconfig('pin', state='normal' if self.show_plinko else 'hidden')
         if not self.show_plinko:
-            self.bounce_effects.clear()
+            self.bounce_count = 0
+            self.update_hot_pins({})
             
     def toggle_coordinates(self):
         self.show_coordinates = not self.show_coordinates
+        self._dirty = True
         self.coordinates_button.config(
             text=f"Coords: {'ON' if self.show_coordinates else 'OFF'} (O)",
             bg='#2ed573' if self.show_coordinates else '#ff4757'
@@ -604,35 +698,206 @@ class AdvancedMouseTracker:
         
     def setup_plinko_pins(self):
         """Initialize plinko pin positions"""
-        pins = []
         rows = int(self.screen_height // self.pin_spacing_y) + 1
         cols = int(self.screen_width // self.pin_spacing_x) + 1
         
-        for row in range(rows):
-            for col in range(cols):
-                offset_x = (self.pin_spacing_x // 2) if row % 2 == 1 else 0
-                x = col * self.pin_spacing_x + offset_x + self.pin_spacing_x // 2
-                y = row * self.pin_spacing_y + self.pin_spacing_y // 2
-                
-                if 0 <= x <= self.screen_width and 0 <= y <= self.screen_height:
-                    pins.append([x, y])
+        # Whole grid at once, odd rows shifted by half a spacing, in row-major order
+        row, col = np.meshgrid(np.arange(rows), np.arange(cols), indexing='ij')
+        offset_x = (row % 2) * (self.pin_spacing_x // 2)
+        xs = col * self.pin_spacing_x + offset_x + self.pin_spacing_x // 2
+        ys = row * self.pin_spacing_y + self.pin_spacing_y // 2
+        on_screen = (xs >= 0) & (xs <= self.screen_width) & (ys >= 0) & (ys <= self.screen_height)
         
-        self.plinko_pins = np.array(pins, dtype=np.float32)
+        self.plinko_pins = np.column_stack([xs[on_screen], ys[on_screen]]).astype(np.float32)
         print(f"📍 Created {len(self.plinko_pins)} plinko pins")
         
+        # Separate contiguous x/y arrays for unit-stride collision math
+        self.pins_x = np.ascontiguousarray(self.plinko_pins[:, 0])
+        self.pins_y = np.ascontiguousarray(self.plinko_pins[:, 1])
+        
+        # Build spatial hash so collision checks only scan nearby pins
+        self.build_pin_grid()
+        
+        # Scratch buffer the collision kernel writes hit indices into
+        self._collision_out = np.empty(len(self.plinko_pins), dtype=np.intp)
+        
+        # Static pins never move, so draw them once, creating every oval in a single
+        # Tcl command that returns the list of new item ids
+        w = str(self.canvas)
+        r = self.pin_radius
+        creates = " ".join(
+            f"[{w} create oval {pin_x - r} {pin_y - r} {pin_x + r} {pin_y + r} "
+            f"-fill #ffa726 -outline #ff6f00 -width 2 -tags pin]"
+            for pin_x, pin_y in self.plinko_pins.tolist()
+        )
+        item_ids = self.canvas.tk.splitlist(self.canvas.tk.eval(f"list {creates}")) if creates else ()
+        self._pin_item_ids = np.array([int(item) for item in item_ids], dtype=np.int32)
+        self._hot_pins = {}  # Pin index -> fill color for pins currently lit by a bounce
+        
+    def build_color_palettes(self):
+        """Precompute color strings indexed by integer velocity buckets"""
+        # Grow ring: bucket = int(min(velocity / 30, 2) * 100)
+        self._grow_palette = []
+        for boost in range(201):
+            intensity = min(255, 100 + boost)
+            self._grow_palette.append(f"#{intensity//4:02x}{intensity//2:02x}{intensity:02x}")
+            
+        # Pointer: bucket = int(min(velocity / 50, 1) * 105)
+        self._pointer_palette = []
+        for boost in range(106):
+            intensity = min(255, 150 + boost)
+            self._pointer_palette.append(f"#{intensity:02x}{intensity//4:02x}{intensity//4:02x}")
+            
+        # Trail: [alpha bucket][velocity bucket], both factors quantized from [0, 1]
+        self.trail_alpha_buckets = 32
+        self.trail_velocity_buckets = 16
+        self._trail_color_lut = []
+        for a in range(self.trail_alpha_buckets):
+            alpha = a / (self.trail_alpha_buckets - 1)
+            row = []
+            for v in range(self.trail_velocity_buckets):
+                velocity_factor = v / (self.trail_velocity_buckets - 1)
+                if velocity_factor < 0.3:
+                    row.append(f'#{int(255 * alpha):02x}{int(200 * alpha):02x}{int(200 * alpha):02x}')
+                elif velocity_factor < 0.6:
+                    row.append(f'#{int(255 * alpha):02x}{int(255 * alpha * velocity_factor):02x}{int(100 * alpha):02x}')
+                else:
+                    row.append(f'#{int(255 * alpha):02x}{int(100 * alpha):02x}{int(255 * alpha * velocity_factor):02x}')
+            self._trail_color_lut.append(row)
+            
+    def create_canvas_items(self):
+        """Create the trail, pointer and coordinate items that are reused every frame"""
+        # Tcl path of the canvas, for batching many item updates into one tk.eval
+        self._canvas_path = str(self.canvas)
+        
+        # Bounce rings come from a fixed pool (up to three concentric rings per effect)
+        self.max_bounce_rings = 3 * self.max_bounce_effects
+        self._ring_item_ids = [
+            self.canvas.create_oval(0, 0, 0, 0, fill='', state='hidden', tags='bounce')
+            for _ in range(self.max_bounce_rings)
+        ]
+        self._rings_visible = 0
+        
+        # Line history is drawn as a handful of polylines, one per fade band
+        self._history_band_ids = [
+            self.canvas.create_line(
+                0, 0, 0, 0, width=1, capstyle='round', joinstyle='round', state='hidden', tags='history'
+            )
+            for _ in range(self.history_bands)
+        ]
+        self._history_band_styles = [None] * self.history_bands  # Last (color, width) sent per band
+        self._history_bands_visible = 0
+        
+        # Trail ovals form a fixed pool, hidden until the trail grows into them
+        self._trail_item_ids = [
+            self.canvas.create_oval(0, 0, 0, 0, outline='', width=0, state='hidden', tags='trail')
+            for _ in range(self.max_trail_length)
+        ]
+        self._trail_visible = 0
+        
+        # Grow ring, pointer and crosshair
+        self._grow_item = self.canvas.create_oval(0, 0, 0, 0, width=3, fill='', tags='pointer')
+        self._pointer_item = self.canvas.create_oval(0, 0, 0, 0, outline='#ffffff', width=2, tags='pointer')
+        self._crosshair_h = self.canvas.create_line(0, 0, 0, 0, width=1, stipple='gray50', tags=('pointer', 'crosshair'))
+        self._crosshair_v = self.canvas.create_line(0, 0, 0, 0, width=1, stipple='gray50', tags=('pointer', 'crosshair'))
+        self._pointer_styles = {}  # Last option string sent per pointer item, to skip redundant itemconfigure
+        
+        # Coordinate readout is a label overlaid on the canvas; Tk sizes it from the font metrics
+        self._coord_label = tk.Label(
+            self.canvas,
+            font=('Segoe UI', 11),
+            fg='#ffffff',
+            bg='#2b2b2b',
+            bd=0,
+            padx=5,
+            pady=10,
+            highlightthickness=1,
+            highlightbackground='#ff4757'
+        )
+        self._coord_label_text = None
+        self._coord_label_visible = False
+        
+    def build_pin_grid(self):
+        """Bucket plinko pin indices into a uniform grid for broadphase collision lookups"""
+        # Cells are twice the collision distance, so any pin in range of a point
+        # lies in the point's own cell or one neighbour along each axis (2x2 block)
+        self.pin_grid_cell = float(2 * self.collision_distance)
+        cell_x = (self.pins_x // self.pin_grid_cell).astype(np.intp)
+        cell_y = (self.pins_y // self.pin_grid_cell).astype(np.intp)
+        self.pin_grid_w = int(cell_x.max()) + 1 if len(cell_x) else 0
+        self.pin_grid_h = int(cell_y.max()) + 1 if len(cell_y) else 0
+        
+        # CSR layout: pin indices sorted by cell, plus each cell's start offset
+        keys = cell_y * self.pin_grid_w + cell_x
+        self.pin_grid_order = np.argsort(keys, kind='stable').astype(np.intp)
+        self.pin_grid_start = np.searchsorted(
+            keys[self.pin_grid_order], np.arange(self.pin_grid_w * self.pin_grid_h + 1)
+        ).astype(np.intp)
+        
+    def add_trail_point(self, x, y, velocity):
+        """Append a trail point, overwriting the oldest once the ring buffer is full"""
+        i = self._trail_head
+        self.trail_x[i] = x
+        self.trail_y[i] = y
+        self.trail_v[i] = velocity
+        self._trail_head = (self._trail_head + 1) % self.max_trail_length
+        if self._trail_count < self.max_trail_length:
+            self._trail_count += 1
+            
+    def ordered_trail_indices(self):
+        """Return ring indices of the trail points ordered from oldest to newest"""
+        start = (self._trail_head - self._trail_count) % self.max_trail_length
+        return self._trail_order[start:start + self._trail_count]
+        
+    def reset_trail(self):
+        """Empty the trail ring buffer"""
+        self._trail_head = 0
+        self._trail_count = 0
+        
+    def add_history_point(self, x, y, delta_x, delta_y):
+        """Append a history sample, overwriting the oldest once the ring buffer is full"""
+        i = self.history_index
+        self.hist_x[i] = x
+        self.hist_y[i] = y
+        self.hist_dx[i] = delta_x
+        self.hist_dy[i] = delta_y
+        self.history_index = (i + 1) % self.max_history_points
+        if self.history_count < self.max_history_points:
+            self.history_count += 1
+            
+    def unroll_history(self, col_a, col_b, out):
+        """Copy two history columns oldest-to-newest into an (n, 2) view of `out`"""
+        n = self.history_count
+        start = (self.history_index - n) % self.max_history_points
+        tail = min(n, self.max_history_points - start)
+        view = out[:n]
+        view[:tail, 0] = col_a[start:start + tail]
+        view[:tail, 1] = col_b[start:start + tail]
+        view[tail:, 0] = col_a[:n - tail]
+        view[tail:, 1] = col_b[:n - tail]
+        return view
+        
+    def ordered_history_xy(self):
+        """Return history positions oldest-to-newest as an (n, 2) view of the scratch buffer"""
+        return self.unroll_history(self.hist_x, self.hist_y, self._history_xy)
+        
+    def ordered_history_deltas(self):
+        """Return history raw deltas oldest-to-newest as an (n, 2) view of the scratch buffer"""
+        return self.unroll_history(self.hist_dx, self.hist_dy, self._history_d)
+        
     def reset_history_points(self):
-        """Reset the history points array"""
-        self.history_points.fill(0)
+        """Reset the history ring (stale samples past history_count are never read)"""
         self.history_count = 0
         self.history_index = 0
         
     def reset_history(self):
         """Reset all history and trails"""
-        self.trail_positions.clear()
+        self.reset_trail()
         self.reset_history_points()
         self.total_mouse_movements = 0
         self.total_raw_distance = 0
-        self.max_velocity = 0
+        self.max_v2 = 0
+        self._dirty = True
         
         # Visual feedback
         original_bg = self.reset_button.cget('bg')
@@ -642,8 +907,7 @@ class AdvancedMouseTracker:
     def on_mouse_move(self, event):
         """Handle mouse movement as fallback when raw input is not available"""
         # Check if raw input is active (received data in the last 100ms)
-        current_time = time.time()
-        if self.raw_input_active and (current_time - self.last_raw_input_time) < 0.1:
+        if self.raw_input_active and (self._clock() - self.last_raw_input_time) < self.raw_input_timeout_ns:
             return  # Raw input is working, don't use fallback
         
         # Calculate deltas from previous position
@@ -656,17 +920,15 @@ class AdvancedMouseTracker:
         self.raw_delta_x = new_x - prev_x
         self.raw_delta_y = new_y - prev_y
         
-        # Calculate movement velocity and direction
-        velocity = math.sqrt(self.raw_delta_x**2 + self.raw_delta_y**2)
+        # Update max velocity tracking on the squared magnitude
+        v2 = self.raw_delta_x * self.raw_delta_x + self.raw_delta_y * self.raw_delta_y
+        if v2 > self.max_v2:
+            self.max_v2 = v2
+            
+        # Calculate movement velocity
+        velocity = math.sqrt(v2)
         self.movement_velocity = velocity
         
-        if velocity > 0:
-            self.movement_direction = math.atan2(self.raw_delta_y, self.raw_delta_x)
-            
-        # Update max velocity tracking
-        if velocity > self.max_velocity:
-            self.max_velocity = velocity
-            
         # Update total statistics
         self.total_mouse_movements += 1
         self.total_raw_distance += velocity
@@ -685,19 +947,13 @@ class AdvancedMouseTracker:
         
         # Store current position in history array with movement data
         if self.show_line_history:
-            self.history_points[self.history_index] = [
-                self.current_x, self.current_y, 
-                self.raw_delta_x, self.raw_delta_y
-            ]
-            self.history_index = (self.history_index + 1) % self.max_history_points
-            if self.history_count < self.max_history_points:
-                self.history_count += 1
+            self.add_history_point(self.current_x, self.current_y, self.raw_delta_x, self.raw_delta_y)
         
         # Add to trail with velocity information
         if self.show_trail:
-            self.trail_positions.append((self.current_x, self.current_y, velocity))
-            if len(self.trail_positions) > self.max_trail_length:
-                self.trail_positions.pop(0)
+            self.add_trail_point(self.current_x, self.current_y, velocity)
+            
+        self._dirty = True
         
     def on_mouse_click(self, event):
         """Handle mouse click"""
@@ -705,29 +961,30 @@ class AdvancedMouseTracker:
         
     def on_resize(self, event):
         """Handle window resize"""
-        if hasattr(self, 'current_x'):
-            self.draw_all()
+        self.canvas_width = event.width
+        self.canvas_height = event.height
+        self.history_display_points = max(1, event.width)
+        self.draw_all()
             
     def update_bounce_effects(self):
         """Update bounce effects with velocity information"""
-        current_time = time.time()
-        active_effects = []
-        
-        for effect in self.bounce_effects:
-            elapsed = current_time - effect['start_time']
-            progress = elapsed / effect['duration']
-            
-            if progress <= 1.0:
-                # Velocity-enhanced animation
-                velocity_factor = effect.get('velocity', 1) / 20.0
-                effect['radius'] = self.pin_radius + (effect['max_radius'] - self.pin_radius) * progress
-                effect['color_intensity'] = int(effect['color_intensity'] * (1 - progress))
-                active_effects.append(effect)
+        if not self.bounce_count:
+            return
+        self._dirty = True
         
-        self.bounce_effects = active_effects
+        # Grow radii, fade colors and drop expired effects in one compiled pass
+        self.bounce_count = step_bounces(
+            self.bounce_x, self.bounce_y, self.bounce_start, self.bounce_duration,
+            self.bounce_max_radius, self.bounce_radius, self.bounce_color_intensity,
+            self.bounce_velocity, self.bounce_pin, self.bounce_count, self._clock(), self._pin_radius_f
+        )
         
     def animate(self):
         """Enhanced animation loop with raw input processing"""
+        # A frame running more than two intervals late skips drawing to catch up
+        now = self._clock()
+        behind = now - self._next_frame_ns > 2 * self.frame_interval_ns
+        
         # Process raw input data
         self.process_raw_input_data()
         
@@ -746,78 +1003,103 @@ class AdvancedMouseTracker:
         # Update statistics display
         self.update_statistics_display()
                 
-        # Draw everything
-        self.draw_all()
+        # Redraw everything only when something changed, otherwise just move the grow ring
+        if behind:
+            pass  # Leave the dirty flag set so the next on-time frame draws
+        elif self._dirty:
+            self.draw_all()
+        elif self.show_grow_animation:
+            self.update_grow_circle()
             
-        # Schedule next frame (higher framerate for smoother raw input)
-        self.root.after(16, self.animate)  # ~60 FPS
+        # Schedule next frame against the deadline so overruns don't accumulate drift;
+        # after falling behind, restart the schedule from now instead of bursting
+        self._next_frame_ns += self.frame_interval_ns
+        if behind:
+            self._next_frame_ns = now + self.frame_interval_ns
+        delay_ms = max(0, (self._next_frame_ns - self._clock()) // 1_000_000)
+        self.root.after(delay_ms, self.animate)
         
     def update_statistics_display(self):
         """Update the statistics display"""
-        if hasattr(self, 'stats_label'):
+        if self.stats_label is not None:
             avg_velocity = self.total_raw_distance / max(1, self.total_mouse_movements)
             
             # Check input method being used
-            current_time = time.time()
-            input_method = "Raw Input" if (self.raw_input_active and (current_time - self.last_raw_input_time) < 0.1) else "Tkinter Fallback"
+            raw_live = self.raw_input_active and (self._clock() - self.last_raw_input_time) < self.raw_input_timeout_ns
+            input_method = "Raw Input" if raw_live else "Tkinter Fallback"
             
-            stats_text = f"{input_method} | Movements: {self.total_mouse_movements} | Distance: {self.total_raw_distance:.1f} | Avg Vel: {avg_velocity:.1f} | Max Vel: {self.max_velocity:.1f} | Clicks: {self.click_count}"
+            stats_text = f"{input_method} | Movements: {self.total_mouse_movements} | Distance: {self.total_raw_distance:.1f} | Avg Vel: {avg_velocity:.1f} | Max Vel: {math.sqrt(self.max_v2):.1f} | Clicks: {self.click_count}"
             self.stats_label.config(text=stats_text)
         
     def draw_all(self):
         """Enhanced drawing with raw input visualization"""
-        # Clear canvas
-        self.canvas.delete("all")
+        # Drop last frame's transient items; persistent ones are updated in place
+        self.canvas.delete('transient')
+        self._dirty = False
         
         x, y = self.current_x, self.current_y
         
-        # Draw plinko pins with velocity-enhanced effects
-        if self.show_plinko:
-            self.draw_enhanced_plinko_pins()
+        # Draw velocity-enhanced bounce effects around the plinko pins
+        # (with plinko off there are no effects, so this just hides leftover rings)
+        self.draw_enhanced_plinko_pins()
         
         # Draw enhanced line history with velocity gradients
         if self.show_line_history and self.history_count > 1:
             self.draw_velocity_enhanced_history()
+        else:
+            self.hide_history_bands()
         
         # Draw enhanced trail with velocity information
-        if self.show_trail and self.trail_positions:
-            self.draw_velocity_enhanced_trail()
+        self.draw_velocity_enhanced_trail()
+        
+        # Grow ring, pointer and crosshair move every frame but rarely change style,
+        # so send all their coords plus only the styles that changed in one Tcl script
+        w = self._canvas_path
+        cmds = []
+        styles = {}
         
         # Draw growing animation circle
         if self.show_grow_animation:
             # Velocity affects grow animation
             velocity_factor = min(self.movement_velocity / 30.0, 2.0)
-            grow_color_intensity = min(255, 100 + int(velocity_factor * 100))
-            grow_color = f"#{grow_color_intensity//4:02x}{grow_color_intensity//2:02x}{grow_color_intensity:02x}"
+            grow_color = self._grow_palette[int(velocity_factor * 100)]
             
-            self.canvas.create_oval(
-                x - self.grow_radius, y - self.grow_radius,
-                x + self.grow_radius, y + self.grow_radius,
-                outline=grow_color, width=3, fill=''
-            )
+            r = self.grow_radius
+            cmds.append(f"{w} coords {self._grow_item} {x - r} {y - r} {x + r} {y + r}")
+            styles[self._grow_item] = f"-outline {grow_color} -state normal"
+        else:
+            styles[self._grow_item] = "-state hidden"
             
         # Draw main pointer circle with velocity indication
         velocity_factor = min(self.movement_velocity / 50.0, 1.0)
-        pointer_color_intensity = min(255, 150 + int(velocity_factor * 105))
-        pointer_color = f"#{pointer_color_intensity:02x}{pointer_color_intensity//4:02x}{pointer_color_intensity//4:02x}"
+        pointer_color = self._pointer_palette[int(velocity_factor * 105)]
         
-        self.canvas.create_oval(
-            x - self.pointer_radius, y - self.pointer_radius,
-            x + self.pointer_radius, y + self.pointer_radius,
-            fill=pointer_color, outline='#ffffff', width=2
-        )
+        r = self.pointer_radius
+        cmds.append(f"{w} coords {self._pointer_item} {x - r} {y - r} {x + r} {y + r}")
+        styles[self._pointer_item] = f"-fill {pointer_color}"
         
         # Draw enhanced crosshair
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width = self.canvas_width
+        canvas_height = self.canvas_height
         
         crosshair_color = '#ff4757' if self.movement_velocity < 10 else '#ffff00'
-        self.canvas.create_line(0, y, canvas_width, y, fill=crosshair_color, width=1, stipple='gray50')
-        self.canvas.create_line(x, 0, x, canvas_height, fill=crosshair_color, width=1, stipple='gray50')
+        cmds.append(f"{w} coords {self._crosshair_h} 0 {y} {canvas_width} {y}")
+        cmds.append(f"{w} coords {self._crosshair_v} {x} 0 {x} {canvas_height}")
+        styles[self._crosshair_h] = styles[self._crosshair_v] = f"-fill {crosshair_color}"
+        
+        last_styles = self._pointer_styles
+        for item, style in styles.items():
+            if last_styles.get(item) != style:
+                last_styles[item] = style
+                cmds.append(f"{w} itemconfigure {item} {style}")
+        self.canvas.tk.eval("\n".join(cmds))
         
         # Draw enhanced coordinates and raw input information
         if self.show_coordinates:
             self.draw_enhanced_coordinates(x, y)
+        elif self._coord_label_visible:
+            self._coord_label.place_forget()
+            self._coord_label_visible = False
         
         # Draw click and wheel effects
         self.draw_enhanced_effects()
@@ -825,100 +1107,160 @@ class AdvancedMouseTracker:
         # Keep UI elements on top
         self.lift_ui_elements()
         
+    def update_grow_circle(self):
+        """Move the grow ring to its current radius without redrawing the scene"""
+        x, y = self.current_x, self.current_y
+        self.canvas.coords(
+            self._grow_item,
+            x - self.grow_radius, y - self.grow_radius,
+            x + self.grow_radius, y + self.grow_radius
+        )
+        
     def draw_enhanced_plinko_pins(self):
-        """Draw plinko pins with enhanced velocity-based effects"""
-        # Draw static pins
-        for pin in self.plinko_pins:
-            pin_x, pin_y = pin[0], pin[1]
-            self.canvas.create_oval(
-                pin_x - self.pin_radius, pin_y - self.pin_radius,
-                pin_x + self.pin_radius, pin_y + self.pin_radius,
-                fill='#ffa726', outline='#ff6f00', width=2
-            )
-            
-        # Draw velocity-enhanced bounce effects
-        for effect in self.bounce_effects:
-            velocity = effect.get('velocity', 1)
-            velocity_factor = min(velocity / 30.0, 2.0)
-            
-            # Velocity affects color intensity
-            intensity = effect['color_intensity']
-            red = min(255, intensity + int(velocity_factor * 50))
-            green = max(0, intensity - int(velocity_factor * 25))
-            blue = max(0, int(velocity_factor * 100))
+        """Draw velocity-enhanced bounce rings over the static plinko pins"""
+        n = self.bounce_count
+        w = self._canvas_path
+        ring_ids = self._ring_item_ids
+        cmds = []
+        hot = {}
+        ring = 0
+        
+        # Velocity affects color intensity and ring count, computed for every effect in one compiled pass
+        bounce_colors(self.bounce_velocity, self.bounce_color_intensity, n, self._bounce_rgb, self._bounce_rings)
+        
+        # Position pooled rings for each effect, batched into a single Tcl script
+        for pin_index, effect_x, effect_y, effect_radius, rings, (red, green, blue) in zip(
+            self.bounce_pin[:n].tolist(),
+            self.bounce_x[:n].tolist(), self.bounce_y[:n].tolist(), self.bounce_radius[:n].tolist(),
+            self._bounce_rings[:n].tolist(), self._bounce_rgb[:n].tolist()
+        ):
             color = f"#{red:02x}{green:02x}{blue:02x}"
+            hot[pin_index] = color
             
             # Draw multiple concentric circles for high velocity
-            for i in range(int(1 + velocity_factor)):
-                radius_offset = i * 5
-                self.canvas.create_oval(
-                    effect['x'] - effect['radius'] - radius_offset,
-                    effect['y'] - effect['radius'] - radius_offset,
-                    effect['x'] + effect['radius'] + radius_offset,
-                    effect['y'] + effect['radius'] + radius_offset,
-                    outline=color, width=max(1, 4 - i), fill=''
+            for i in range(rings):
+                ring_radius = effect_radius + i * 5
+                item = ring_ids[ring]
+                ring += 1
+                cmds.append(
+                    f"{w} coords {item} {effect_x - ring_radius} {effect_y - ring_radius} "
+                    f"{effect_x + ring_radius} {effect_y + ring_radius}"
                 )
+                cmds.append(f"{w} itemconfigure {item} -outline {color} -width {max(1, 4 - i)} -state normal")
+                
+        # Hide pool rings no effect uses this frame
+        for item in ring_ids[ring:self._rings_visible]:
+            cmds.append(f"{w} itemconfigure {item} -state hidden")
+        self._rings_visible = ring
+        
+        # Light the struck pins themselves
+        self.update_hot_pins(hot, cmds)
+        if cmds:
+            self.canvas.tk.eval("\n".join(cmds))
+        
+    def update_hot_pins(self, hot, cmds=None):
+        """Recolor only pins whose bounce state changed, restoring pins that cooled down"""
+        # Append to the caller's Tcl batch if given, otherwise run our own
+        batch = [] if cmds is None else cmds
+        w = self._canvas_path
+        pin_ids = self._pin_item_ids
+        for pin_index in self._hot_pins.keys() - hot.keys():
+            batch.append(f"{w} itemconfigure {pin_ids[pin_index]} -fill #ffa726")
+        for pin_index, color in hot.items():
+            if self._hot_pins.get(pin_index) != color:
+                batch.append(f"{w} itemconfigure {pin_ids[pin_index]} -fill {color}")
+        self._hot_pins = hot
+        if cmds is None and batch:
+            self.canvas.tk.eval("\n".join(batch))
         
     def draw_velocity_enhanced_history(self):
         """Draw line history with velocity-based visualization"""
-        if self.history_count < self.max_history_points:
-            points = self.history_points[:self.history_count]
-        else:
-            points = np.concatenate([
-                self.history_points[self.history_index:],
-                self.history_points[:self.history_index]
-            ])
-        
-        for i in range(len(points) - 1):
-            start = points[i]
-            end = points[i + 1]
-            
-            # Calculate velocity from delta information
-            delta_magnitude = math.sqrt(start[2]**2 + start[3]**2)
-            velocity_factor = min(delta_magnitude / 20.0, 1.0)
+        # Unroll the ring buffer oldest-to-newest, striding through long histories
+        # so the line always ends on the newest point
+        points = self.ordered_history_xy()
+        deltas = self.ordered_history_deltas()
+        stride = max(1, self.history_count // self.history_display_points)
+        if stride > 1:
+            offset = (self.history_count - 1) % stride
+            points = points[offset::stride]
+            deltas = deltas[offset::stride]
             
-            # Alpha for gradient effect
-            alpha = (i + 1) / len(points)
-            
-            # Velocity affects color and width
-            base_intensity = int(100 + (155 * alpha))
-            velocity_boost = int(velocity_factor * 100)
-            
-            red = min(255, base_intensity//3 + velocity_boost)
-            green = min(255, base_intensity//2 + velocity_boost//2)
-            blue = min(255, base_intensity + velocity_boost//3)
-            color = f"#{red:02x}{green:02x}{blue:02x}"
-            
-            # Width varies with velocity and position
-            width = max(1, int(3 * alpha * (1 + velocity_factor)))
-            
-            self.canvas.create_line(
-                start[0], start[1], end[0], end[1],
-                fill=color, width=width, capstyle='round'
-            )
+        # Split the line into bands; each band is one polyline sharing its end point with the next
+        num_points = len(points)
+        num_bands = min(self.history_bands, num_points - 1)
+        bounds = np.linspace(0, num_points - 1, num_bands + 1).astype(np.intp)
+        
+        # Velocity, alpha, color channels and widths for every band at once
+        magnitudes = np.hypot(deltas[:-1, 0], deltas[:-1, 1])
+        velocity_factors = np.minimum(magnitudes / 20.0, 1.0)
+        band_velocity = np.add.reduceat(velocity_factors, bounds[:-1]) / np.diff(bounds)
+        alphas = bounds[1:] / (num_points - 1)
+        base = (100 + 155 * alphas).astype(np.int32)
+        boost = (band_velocity * 100).astype(np.int32)
+        reds = np.minimum(255, base // 3 + boost)
+        greens = np.minimum(255, base // 2 + boost // 2)
+        blues = np.minimum(255, base + boost // 3)
+        widths = np.maximum(1, (3 * alphas * (1 + band_velocity)).astype(np.int32))
+        
+        # Bands are persistent items: move every band, but only restyle the ones whose look changed
+        band_items = self._history_band_ids
+        band_styles = self._history_band_styles
+        w = self._canvas_path
+        cmds = []
+        for b, (red, green, blue, width) in enumerate(zip(reds.tolist(), greens.tolist(), blues.tolist(), widths.tolist())):
+            coords = " ".join(map(str, points[bounds[b]:bounds[b + 1] + 1].ravel().tolist()))
+            cmds.append(f"{w} coords {band_items[b]} {coords}")
+            style = (f"#{red:02x}{green:02x}{blue:02x}", width)
+            if style != band_styles[b]:
+                band_styles[b] = style
+                cmds.append(f"{w} itemconfigure {band_items[b]} -fill {style[0]} -width {width}")
+                
+        # Show newly reached bands and hide the ones a shorter history no longer reaches
+        for item in band_items[self._history_bands_visible:num_bands]:
+            cmds.append(f"{w} itemconfigure {item} -state normal")
+        for item in band_items[num_bands:self._history_bands_visible]:
+            cmds.append(f"{w} itemconfigure {item} -state hidden")
+        self._history_bands_visible = num_bands
+        
+        # One Tcl round trip for the whole history
+        self.canvas.tk.eval("\n".join(cmds))
+        
+    def hide_history_bands(self):
+        """Hide every visible history band"""
+        if self._history_bands_visible:
+            self.canvas.itemconfig('history', state='hidden')
+            self._history_bands_visible = 0
         
     def draw_velocity_enhanced_trail(self):
         """Draw trail with velocity information"""
-        for i, (trail_x, trail_y, velocity) in enumerate(self.trail_positions):
-            alpha = (i + 1) / len(self.trail_positions)
-            velocity_factor = min(velocity / 30.0, 1.0)
-            
-            # Radius varies with velocity
-            trail_radius = self.pointer_radius * (0.2 + 0.8 * alpha) * (1 + velocity_factor * 0.5)
+        trail_count = self._trail_count if self.show_trail else 0
+        trail_items = self._trail_item_ids
+        w = self._canvas_path
+        cmds = []
+        lut = self._trail_color_lut
+        
+        # Radius (varies with velocity) and color bucket for every trail point in one compiled pass
+        trail_sprites(
+            self.trail_x, self.trail_y, self.trail_v, self.ordered_trail_indices(), trail_count,
+            float(self.pointer_radius), self.trail_alpha_buckets - 1, self.trail_velocity_buckets - 1,
+            self._trail_boxes, self._trail_buckets
+        )
+        
+        for i, ((x0, y0, x1, y1), (a, v)) in enumerate(zip(
+            self._trail_boxes[:trail_count].tolist(), self._trail_buckets[:trail_count].tolist()
+        )):
+            color = lut[a][v]
+            cmds.append(f"{w} coords {trail_items[i]} {x0} {y0} {x1} {y1}")
+            cmds.append(f"{w} itemconfigure {trail_items[i]} -fill {color} -state normal")
             
-            # Color intensity varies with velocity
-            if velocity_factor < 0.3:
-                color = f'#{int(255 * alpha):02x}{int(200 * alpha):02x}{int(200 * alpha):02x}'
-            elif velocity_factor < 0.6:
-                color = f'#{int(255 * alpha):02x}{int(255 * alpha * velocity_factor):02x}{int(100 * alpha):02x}'
-            else:
-                color = f'#{int(255 * alpha):02x}{int(100 * alpha):02x}{int(255 * alpha * velocity_factor):02x}'
-                
-            self.canvas.create_oval(
-                trail_x - trail_radius, trail_y - trail_radius,
-                trail_x + trail_radius, trail_y + trail_radius,
-                fill=color, outline='', width=0
-            )
+        # Hide pool items the trail no longer reaches
+        for item in trail_items[trail_count:self._trail_visible]:
+            cmds.append(f"{w} itemconfigure {item} -state hidden")
+        self._trail_visible = trail_count
+        
+        # One Tcl round trip for the whole trail
+        if cmds:
+            self.canvas.tk.eval("\n".join(cmds))
         
     def draw_enhanced_coordinates(self, x, y):
         """Draw enhanced coordinate information with raw input data"""
@@ -935,48 +1277,42 @@ class AdvancedMouseTracker:
         if self.show_velocity_info:
             coord_lines.append(f"Velocity: {self.movement_velocity:.1f}")
             if self.movement_velocity > 0:
-                direction_deg = math.degrees(self.movement_direction)
+                # Direction is only needed for this readout, so derive it here
+                direction_deg = math.degrees(math.atan2(self.raw_delta_y, self.raw_delta_x))
                 coord_lines.append(f"Direction: {direction_deg:.0f}°")
         
         # Trail and history counts
-        if self.trail_positions:
-            coord_lines.append(f"Trail: {len(self.trail_positions)}")
+        if self._trail_count:
+            coord_lines.append(f"Trail: {self._trail_count}")
         if self.history_count > 0:
             coord_lines.append(f"Points: {self.history_count}")
         
         # Create text display
         coord_text = " | ".join(coord_lines)
         
-        # Position text near cursor
-        text_x = x + 25
+        # Update text only when it changed
+        if coord_text != self._coord_label_text:
+            self._coord_label.configure(text=coord_text)
+            self._coord_label_text = coord_text
+            
+        # Position label near cursor
+        text_x = x + 20
         text_y = y - 45
         
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-        
-        # Keep text on screen
-        text_width = len(coord_text) * 8
-        if text_x + text_width > canvas_width:
-            text_x = x - text_width - 25
+        # Keep label on screen, using the width Tk measured for the text
+        label_width = self._coord_label.winfo_reqwidth()
+        if text_x + label_width > self.canvas_width:
+            text_x = x - label_width - 20
         if text_y < 20:
             text_y = y + 45
             
-        # Draw background
-        self.canvas.create_rectangle(
-            text_x - 5, text_y - 20, text_x + text_width + 5, text_y + 20,
-            fill='#2b2b2b', outline='#ff4757', width=1
-        )
-        
-        # Draw text
-        self.canvas.create_text(
-            text_x, text_y, text=coord_text, anchor='w',
-            font=('Segoe UI', 11), fill='#ffffff'
-        )
+        self._coord_label.place(x=text_x, y=text_y, anchor='w')
+        self._coord_label_visible = True
         
     def draw_enhanced_effects(self):
         """Draw enhanced click and wheel effects"""
         # Enhanced click effect
-        if hasattr(self, 'click_effect') and self.click_effect:
+        if self.click_effect:
             effect = self.click_effect
             button_colors = {
                 'Left': '#ff4757',
@@ -994,16 +1330,17 @@ class AdvancedMouseTracker:
                     self.canvas.create_oval(
                         effect['x'] - ring_radius, effect['y'] - ring_radius,
                         effect['x'] + ring_radius, effect['y'] + ring_radius,
-                        outline=color, width=max(1, 4-ring), fill=''
+                        outline=color, width=max(1, 4-ring), fill='', tags='transient'
                     )
             
             effect['radius'] += 3
             effect['lifetime'] -= 1
             if effect['lifetime'] <= 0:
-                del self.click_effect
+                self.click_effect = None
+            self._dirty = True
         
         # Enhanced wheel effect
-        if hasattr(self, 'wheel_effect') and self.wheel_effect:
+        if self.wheel_effect:
             effect = self.wheel_effect
             direction = "↑" if effect['delta'] > 0 else "↓"
             
@@ -1011,21 +1348,18 @@ class AdvancedMouseTracker:
                 effect['x'], effect['y'] - 30,
                 text=f"Wheel {direction} {abs(effect['delta'])}",
                 font=('Segoe UI', 14, 'bold'),
-                fill='#00d2d3'
+                fill='#00d2d3', tags='transient'
             )
             
             effect['lifetime'] -= 1
             if effect['lifetime'] <= 0:
-                del self.wheel_effect
+                self.wheel_effect = None
+            self._dirty = True
         
     def lift_ui_elements(self):
         """Keep UI elements on top"""
-        elements = [
-            'reset_button', 'controls_frame', 'exit_button', 'stats_label'
-        ]
-        for element_name in elements:
-            if hasattr(self, element_name):
-                getattr(self, element_name).lift()
+        for element in self._ui_elements:
+            element.lift()
         
     def stop_and_quit(self):
         """Safely stop the application"""
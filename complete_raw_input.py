@@ -15,7 +15,7 @@ import threading
 from ctypes import wintypes
 
 # Additional type definitions not in wintypes
-LRESULT = ctypes.c_long
+LRESULT = wintypes.LPARAM  # LONG_PTR: pointer-sized, like LPARAM
 HCURSOR = ctypes.c_void_p
 WINFUNCTYPE = ctypes.WINFUNCTYPE
 
@@ -23,14 +23,24 @@ WINFUNCTYPE = ctypes.WINFUNCTYPE
 WM_INPUT = 0x00FF
 WM_DESTROY = 0x0002
 WM_CLOSE = 0x0010
+WM_QUIT = 0x0012
+
+PM_REMOVE = 0x0001
 
 RIM_TYPEMOUSE = 0
 RIM_TYPEKEYBOARD = 1
 RIM_TYPEHID = 2
 
+RID_INPUT = 0x10000003
+
 RIDEV_INPUTSINK = 0x00000100
 RIDEV_NOLEGACY = 0x00000030
 
+# RAWINPUT records in a GetRawInputBuffer batch start on pointer-size boundaries (NEXTRAWINPUTBLOCK)
+RAWINPUT_ALIGN = ctypes.sizeof(ctypes.c_void_p)
+RAW_INPUT_BUFFER_SIZE = 64 * 1024
+RAW_INPUT_ERROR = 0xFFFFFFFF  # (UINT)-1 returned by GetRawInputData / GetRawInputBuffer on failure
+
 # Mouse button flags
 RI_MOUSE_LEFT_BUTTON_DOWN = 0x0001
 RI_MOUSE_LEFT_BUTTON_UP = 0x0002
@@ -39,6 +49,17 @@ RI_MOUSE_RIGHT_BUTTON_UP = 0x0008
 RI_MOUSE_MIDDLE_BUTTON_DOWN = 0x0010
 RI_MOUSE_MIDDLE_BUTTON_UP = 0x0020
 RI_MOUSE_WHEEL = 0x0400
+RI_MOUSE_BUTTON_MASK = 0x03FF
+
+# Button transition flag -> (button, action), in the order transitions are reported
+BUTTON_TABLE = {
+    RI_MOUSE_LEFT_BUTTON_DOWN: ('left', 'down'),
+    RI_MOUSE_LEFT_BUTTON_UP: ('left', 'up'),
+    RI_MOUSE_RIGHT_BUTTON_DOWN: ('right', 'down'),
+    RI_MOUSE_RIGHT_BUTTON_UP: ('right', 'up'),
+    RI_MOUSE_MIDDLE_BUTTON_DOWN: ('middle', 'down'),
+    RI_MOUSE_MIDDLE_BUTTON_UP: ('middle', 'up'),
+}
 
 # Define all required structures
 class POINT(ctypes.Structure):
@@ -101,6 +122,10 @@ class RAWINPUT(ctypes.Structure):
         ("data", RAWINPUT_UNION)
     ]
 
+# Record sizes passed to every GetRawInputData / GetRawInputBuffer call, computed once
+RAWINPUTHEADER_SIZE = ctypes.sizeof(RAWINPUTHEADER)
+RAWINPUT_SIZE = ctypes.sizeof(RAWINPUT)
+
 class MSG(ctypes.Structure):
     _fields_ = [
         ("hwnd", wintypes.HWND),
@@ -127,10 +152,44 @@ class WNDCLASSEX(ctypes.Structure):
         ("hIconSm", wintypes.HICON)
     ]
 
+# Prototype the Win32 calls used by the window and message pump once at import,
+# so each ctypes dispatch converts arguments directly instead of guessing their types.
+# Private handles keep these prototypes from leaking into other modules that share
+# ctypes.windll; use_last_error makes ctypes.get_last_error() meaningful
+user32 = ctypes.WinDLL('user32', use_last_error=True)
+kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+kernel32.GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+user32.LoadCursorW.argtypes = [wintypes.HINSTANCE, ctypes.c_void_p]  # c_void_p accepts MAKEINTRESOURCE ids
+user32.LoadCursorW.restype = HCURSOR
+user32.RegisterClassExW.argtypes = [ctypes.POINTER(WNDCLASSEX)]
+user32.RegisterClassExW.restype = wintypes.ATOM
+user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+user32.DefWindowProcW.restype = LRESULT
+user32.GetMessageW.argtypes = [ctypes.POINTER(MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+user32.GetMessageW.restype = wintypes.BOOL
+user32.PeekMessageW.argtypes = [ctypes.POINTER(MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT, wintypes.UINT]
+user32.PeekMessageW.restype = wintypes.BOOL
+user32.TranslateMessage.argtypes = [ctypes.POINTER(MSG)]
+user32.TranslateMessage.restype = wintypes.BOOL
+user32.DispatchMessageW.argtypes = [ctypes.POINTER(MSG)]
+user32.DispatchMessageW.restype = LRESULT
+user32.GetRawInputData.argtypes = [
+    wintypes.HANDLE, wintypes.UINT, ctypes.c_void_p, ctypes.POINTER(wintypes.UINT), wintypes.UINT
+]
+user32.GetRawInputData.restype = wintypes.UINT
+user32.GetRawInputBuffer.argtypes = [ctypes.c_void_p, ctypes.POINTER(wintypes.UINT), wintypes.UINT]
+user32.GetRawInputBuffer.restype = wintypes.UINT
+
+# Process module handle and default arrow cursor never change, so look them up once
+MODULE_HANDLE = kernel32.GetModuleHandleW(None)
+ARROW_CURSOR = user32.LoadCursorW(None, 32512)  # IDC_ARROW
+
 class CompleteRawInputCapture:
-    def __init__(self):
-        self.user32 = ctypes.windll.user32
-        self.kernel32 = ctypes.windll.kernel32
+    def __init__(self, capture_keyboard=False):
+        self.user32 = user32
+        self.kernel32 = kernel32
         
         # Window management
         self.hwnd = None
@@ -138,6 +197,9 @@ class CompleteRawInputCapture:
         self.class_name = "RawInputWindow"
         self.window_proc = None
         
+        # Keyboard is opt-in: typing would otherwise add WM_INPUT traffic to a mouse tracker
+        self.capture_keyboard = capture_keyboard
+        
         # Statistics
         self.mouse_moves = 0
         self.mouse_clicks = 0
@@ -148,18 +210,65 @@ class CompleteRawInputCapture:
         # Callback
         self.callback = None
         
+        # Reused for every mouse move so high-rate mice don't allocate a dict per packet
+        self._mouse_event = {
+            'type': 'mouse_move',
+            'delta_x': 0,
+            'delta_y': 0,
+            'total_x': 0,
+            'total_y': 0,
+            'move_count': 0,
+            'timestamp': 0.0
+        }
+        
+        # Coalesced mouse movement (see enable_move_coalescing)
+        self.coalesce_moves = False
+        self._pending_dx = 0
+        self._pending_dy = 0
+        self._pending_count = 0
+        self._pending_lock = threading.Lock()
+        
+        # Preallocated raw input buffers, with slack so the last record of a batch can always be mapped
+        self._raw_input = RAWINPUT()
+        self._raw_input_ref = ctypes.byref(self._raw_input)
+        self._raw_buffer = ctypes.create_string_buffer(RAW_INPUT_BUFFER_SIZE + ctypes.sizeof(RAWINPUT))
+        self._raw_size = wintypes.UINT()
+        self._raw_size_ref = ctypes.byref(self._raw_size)
+        
+        # Bind the per-message raw input calls (prototyped at import) to skip attribute lookups
+        self._GetRawInputData = self.user32.GetRawInputData
+        self._GetRawInputBuffer = self.user32.GetRawInputBuffer
+        
         # Setup window procedure
         self.setup_window_proc()
         
     def set_callback(self, callback_func):
-        """Set callback function for raw input events"""
+        """Set callback function for raw input events (mouse move dicts are reused, copy what you keep)"""
         self.callback = callback_func
         
+    def enable_move_coalescing(self):
+        """
+        Accumulate mouse movement instead of calling the callback per packet.
+        
+        A consumer running at its own rate (e.g. a Tk after() tick) calls
+        drain_moves() to collect everything that arrived since the last drain.
+        Button and keyboard events still go through the callback.
+        """
+        self.coalesce_moves = True
+        
+    def drain_moves(self):
+        """Return (delta_x, delta_y, packet_count) accumulated since the last drain"""
+        with self._pending_lock:
+            moves = (self._pending_dx, self._pending_dy, self._pending_count)
+            self._pending_dx = self._pending_dy = self._pending_count = 0
+        return moves
+        
     def setup_window_proc(self):
         """Setup the window procedure to handle messages"""
         def window_proc(hwnd, msg, wParam, lParam):
             if msg == WM_INPUT:
                 self.handle_raw_input(lParam)
+                self.drain_raw_input_buffer()
                 return 0
             elif msg == WM_CLOSE or msg == WM_DESTROY:
                 print("🛑 Window closing...")
@@ -185,9 +294,9 @@ class CompleteRawInputCapture:
         wc.lpfnWndProc = self.window_proc
         wc.cbClsExtra = 0
         wc.cbWndExtra = 0
-        wc.hInstance = self.kernel32.GetModuleHandleW(None)
+        wc.hInstance = MODULE_HANDLE
         wc.hIcon = None
-        wc.hCursor = self.user32.LoadCursorW(None, 32512)  # IDC_ARROW
+        wc.hCursor = ARROW_CURSOR
         wc.hbrBackground = ctypes.c_void_p(6)  # COLOR_WINDOW + 1
         wc.lpszMenuName = None
         wc.lpszClassName = self.class_name
@@ -216,7 +325,7 @@ class CompleteRawInputCapture:
             100, 100, 500, 400,         # Position and size
             None,                       # Parent window
             None,                       # Menu
-            self.kernel32.GetModuleHandleW(None),  # Instance
+            MODULE_HANDLE,              # Instance
             None                        # Additional data
         )
         
@@ -244,21 +353,26 @@ class CompleteRawInputCapture:
         mouse_device.dwFlags = RIDEV_INPUTSINK
         mouse_device.hwndTarget = self.hwnd
         
+        device_list = [mouse_device]
+        
         # Keyboard
-        keyboard_device = RAWINPUTDEVICE()
-        keyboard_device.usUsagePage = 0x01  # Generic Desktop
-        keyboard_device.usUsage = 0x06      # Keyboard
-        keyboard_device.dwFlags = RIDEV_INPUTSINK
-        keyboard_device.hwndTarget = self.hwnd
-        
-        # Register both devices
-        devices = (RAWINPUTDEVICE * 2)(mouse_device, keyboard_device)
+        if self.capture_keyboard:
+            keyboard_device = RAWINPUTDEVICE()
+            keyboard_device.usUsagePage = 0x01  # Generic Desktop
+            keyboard_device.usUsage = 0x06      # Keyboard
+            keyboard_device.dwFlags = RIDEV_INPUTSINK
+            keyboard_device.hwndTarget = self.hwnd
+            device_list.append(keyboard_device)
+        
+        # Register the selected devices
+        devices = (RAWINPUTDEVICE * len(device_list))(*device_list)
         result = self.user32.RegisterRawInputDevices(
-            devices, 2, ctypes.sizeof(RAWINPUTDEVICE)
+            devices, len(device_list), ctypes.sizeof(RAWINPUTDEVICE)
         )
         
         if result:
-            print("✅ Successfully registered mouse and keyboard for raw input")
+            registered = "mouse and keyboard" if self.capture_keyboard else "mouse"
+            print(f"✅ Successfully registered {registered} for raw input")
             return True
         else:
             error = ctypes.get_last_error()
@@ -268,40 +382,50 @@ class CompleteRawInputCapture:
     def handle_raw_input(self, lParam):
         """Handle raw input message"""
         try:
-            # Get the size of raw input data
-            size = wintypes.UINT()
-            self.user32.GetRawInputData(
-                lParam, 
-                0x10000003,  # RID_INPUT
-                None, 
-                ctypes.byref(size), 
-                ctypes.sizeof(RAWINPUTHEADER)
-            )
-            
-            # Get the actual data
-            buffer = ctypes.create_string_buffer(size.value)
-            result = self.user32.GetRawInputData(
+            # Mouse and keyboard packets always fit in one RAWINPUT, so skip the size query
+            self._raw_size.value = RAWINPUT_SIZE
+            result = self._GetRawInputData(
                 lParam,
-                0x10000003,  # RID_INPUT
-                buffer,
-                ctypes.byref(size),
-                ctypes.sizeof(RAWINPUTHEADER)
+                RID_INPUT,
+                self._raw_input_ref,
+                self._raw_size_ref,
+                RAWINPUTHEADER_SIZE
             )
             
-            if result != size.value:
+            if result == 0 or result == RAW_INPUT_ERROR:
                 return
                 
-            # Parse the raw input
-            raw_input = ctypes.cast(buffer, ctypes.POINTER(RAWINPUT)).contents
-            
-            if raw_input.header.dwType == RIM_TYPEMOUSE:
-                self.handle_mouse_input(raw_input.data.mouse)
-            elif raw_input.header.dwType == RIM_TYPEKEYBOARD:
-                self.handle_keyboard_input(raw_input.data.keyboard)
+            self.dispatch_raw_input(self._raw_input)
                 
         except Exception as e:
             print(f"❌ Error handling raw input: {e}")
             
+    def drain_raw_input_buffer(self):
+        """Dispatch raw input still queued behind the current WM_INPUT, many records per call"""
+        try:
+            while True:
+                self._raw_size.value = RAW_INPUT_BUFFER_SIZE
+                count = self._GetRawInputBuffer(self._raw_buffer, self._raw_size_ref, RAWINPUTHEADER_SIZE)
+                if count == 0 or count == RAW_INPUT_ERROR:
+                    return
+                    
+                # Walk the records, each aligned like NEXTRAWINPUTBLOCK
+                offset = 0
+                for _ in range(count):
+                    raw_input = RAWINPUT.from_buffer(self._raw_buffer, offset)
+                    self.dispatch_raw_input(raw_input)
+                    offset += (raw_input.header.dwSize + RAWINPUT_ALIGN - 1) & ~(RAWINPUT_ALIGN - 1)
+                    
+        except Exception as e:
+            print(f"❌ Error draining raw input buffer: {e}")
+            
+    def dispatch_raw_input(self, raw_input):
+        """Route one RAWINPUT record to the mouse or keyboard handler"""
+        if raw_input.header.dwType == RIM_TYPEMOUSE:
+            self.handle_mouse_input(raw_input.data.mouse)
+        elif raw_input.header.dwType == RIM_TYPEKEYBOARD:
+            self.handle_keyboard_input(raw_input.data.keyboard)
+            
     def handle_mouse_input(self, mouse_data):
         """Handle raw mouse input"""
         if mouse_data.lLastX != 0 or mouse_data.lLastY != 0:
@@ -309,17 +433,19 @@ class CompleteRawInputCapture:
             self.total_x += mouse_data.lLastX
             self.total_y += mouse_data.lLastY
             
-            data = {
-                'type': 'mouse_move',
-                'delta_x': mouse_data.lLastX,
-                'delta_y': mouse_data.lLastY,
-                'total_x': self.total_x,
-                'total_y': self.total_y,
-                'move_count': self.mouse_moves,
-                'timestamp': time.time()
-            }
-            
-            if self.callback:
+            if self.coalesce_moves:
+                with self._pending_lock:
+                    self._pending_dx += mouse_data.lLastX
+                    self._pending_dy += mouse_data.lLastY
+                    self._pending_count += 1
+            elif self.callback:
+                data = self._mouse_event
+                data['delta_x'] = mouse_data.lLastX
+                data['delta_y'] = mouse_data.lLastY
+                data['total_x'] = self.total_x
+                data['total_y'] = self.total_y
+                data['move_count'] = self.mouse_moves
+                data['timestamp'] = time.perf_counter()
                 self.callback(data)
             else:
                 print(f"🖱️  Mouse: Δ({mouse_data.lLastX:+4d}, {mouse_data.lLastY:+4d}) → Total({self.total_x:6d}, {self.total_y:6d}) [Move #{self.mouse_moves}]")
@@ -347,20 +473,16 @@ class CompleteRawInputCapture:
                     
     def decode_mouse_button(self, button_flags, button_data):
         """Decode mouse button information"""
-        if button_flags & RI_MOUSE_LEFT_BUTTON_DOWN:
-            return {'button': 'left', 'action': 'down'}
-        elif button_flags & RI_MOUSE_LEFT_BUTTON_UP:
-            return {'button': 'left', 'action': 'up'}
-        elif button_flags & RI_MOUSE_RIGHT_BUTTON_DOWN:
-            return {'button': 'right', 'action': 'down'}
-        elif button_flags & RI_MOUSE_RIGHT_BUTTON_UP:
-            return {'button': 'right', 'action': 'up'}
-        elif button_flags & RI_MOUSE_MIDDLE_BUTTON_DOWN:
-            return {'button': 'middle', 'action': 'down'}
-        elif button_flags & RI_MOUSE_MIDDLE_BUTTON_UP:
-            return {'button': 'middle', 'action': 'up'}
+        # A single transition (the usual case) is one table lookup
+        button_bits = button_flags & RI_MOUSE_BUTTON_MASK
+        entry = BUTTON_TABLE.get(button_bits)
+        if entry is None and button_bits:
+            # Several transitions in one packet: report the first, in table order
+            entry = next((value for flag, value in BUTTON_TABLE.items() if button_bits & flag), None)
+        if entry is not None:
+            return {'button': entry[0], 'action': entry[1]}
         elif button_flags & RI_MOUSE_WHEEL:
-            delta = ctypes.c_short(button_data).value
+            delta = (button_data ^ 0x8000) - 0x8000  # Sign-extend the 16-bit wheel delta
             direction = "up" if delta > 0 else "down"
             return {'button': 'wheel', 'action': direction, 'data': delta}
         else:
@@ -412,10 +534,12 @@ class CompleteRawInputCapture:
         print("   Close the window to stop")
         
         msg = MSG()
+        msg_ref = ctypes.byref(msg)
         self.running = True
         
         while self.running:
-            bRet = self.user32.GetMessageW(ctypes.byref(msg), None, 0, 0)
+            # Block until something arrives...
+            bRet = self.user32.GetMessageW(msg_ref, None, 0, 0)
             
             if bRet == 0:  # WM_QUIT
                 break
@@ -423,12 +547,28 @@ class CompleteRawInputCapture:
                 error = ctypes.get_last_error()
                 print(f"❌ GetMessage error: {error}")
                 break
-            else:
-                self.user32.TranslateMessage(ctypes.byref(msg))
-                self.user32.DispatchMessageW(ctypes.byref(msg))
+            self.dispatch_message(msg)
+            
+            # ...then handle everything already queued without blocking again
+            while self.running and self.user32.PeekMessageW(msg_ref, None, 0, 0, PM_REMOVE):
+                if msg.message == WM_QUIT:
+                    self.running = False
+                    break
+                self.dispatch_message(msg)
                 
         print("👋 Message loop ended")
         
+    def dispatch_message(self, msg):
+        """Handle our WM_INPUT directly, translate and dispatch everything else"""
+        # Raw input skips TranslateMessage/DispatchMessageW and the window procedure callback round trip
+        if msg.message == WM_INPUT and msg.hwnd == self.hwnd:
+            self.handle_raw_input(msg.lParam)
+            self.drain_raw_input_buffer()
+            return
+        msg_ref = ctypes.byref(msg)
+        self.user32.TranslateMessage(msg_ref)
+        self.user32.DispatchMessageW(msg_ref)
+        
     def run(self):
         """Main run method"""
         print("🚀 Complete Raw Input Capture")
@@ -462,7 +602,7 @@ class CompleteRawInputCapture:
 
 def main():
     """Main function"""
-    capture = CompleteRawInputCapture()
+    capture = CompleteRawInputCapture(capture_keyboard=True)
     capture.run()
 
 if __name__ == "__main__":
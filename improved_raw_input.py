@@ -9,11 +9,22 @@ Raw input requires a window handle to work properly on most Windows systems.
 
 import ctypes
 import ctypes.wintypes
+import logging
+import queue
+import struct
 import sys
 import threading
 import time
 import tkinter as tk
 from ctypes import wintypes
+from logging.handlers import QueueHandler, QueueListener
+
+import numpy as np
+
+from tracker_kernels import (
+    update_mouse, MOUSE_TOTAL_X, MOUSE_TOTAL_Y, MOUSE_CLICKS, MOUSE_WHEEL_TOTAL,
+    MOUSE_EVENT_MOVE, MOUSE_EVENT_WHEEL, MOUSE_EVENT_BUTTON
+)
 
 # Windows API constants
 WM_INPUT = 0x00FF
@@ -21,9 +32,18 @@ RIM_TYPEMOUSE = 0
 RIM_TYPEKEYBOARD = 1
 RIM_TYPEHID = 2
 
+RID_INPUT = 0x10000003
+
+GWLP_WNDPROC = -4
+
 RIDEV_INPUTSINK = 0x00000100
 RIDEV_NOLEGACY = 0x00000030
 
+# (usUsagePage, usUsage) pairs registered for each device class
+MOUSE_USAGES = ((0x01, 0x02),)                # Generic Desktop: Mouse
+KEYBOARD_USAGES = ((0x01, 0x06),)             # Generic Desktop: Keyboard
+HID_USAGES = ((0x01, 0x04), (0x01, 0x05))     # Generic Desktop: Joystick, Game Pad
+
 # Mouse button flags
 RI_MOUSE_LEFT_BUTTON_DOWN = 0x0001
 RI_MOUSE_LEFT_BUTTON_UP = 0x0002
@@ -33,6 +53,16 @@ RI_MOUSE_MIDDLE_BUTTON_DOWN = 0x0010
 RI_MOUSE_MIDDLE_BUTTON_UP = 0x0020
 RI_MOUSE_WHEEL = 0x0400
 
+# Button transition flag, name and state, indexed by the flag's bit position (update_mouse returns it)
+BUTTON_TABLE = (
+    (RI_MOUSE_LEFT_BUTTON_DOWN, "Left", "Down"),
+    (RI_MOUSE_LEFT_BUTTON_UP, "Left", "Up"),
+    (RI_MOUSE_RIGHT_BUTTON_DOWN, "Right", "Down"),
+    (RI_MOUSE_RIGHT_BUTTON_UP, "Right", "Up"),
+    (RI_MOUSE_MIDDLE_BUTTON_DOWN, "Middle", "Down"),
+    (RI_MOUSE_MIDDLE_BUTTON_UP, "Middle", "Up"),
+)
+
 # Define structures (same as before)
 class POINT(ctypes.Structure):
     _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
@@ -94,25 +124,87 @@ class RAWINPUT(ctypes.Structure):
         ("data", RAWINPUT_UNION)
     ]
 
+# Display names for every 8-bit virtual-key code, built once
+VK_NAMES = tuple(f"VK_{vkey:02X}" for vkey in range(256))
+
+# Delay between the first stat change and the label refresh it schedules
+STATS_REFRESH_MS = 100
+
+# How often the Tk thread checks whether a stop has been requested
+STOP_POLL_MS = 100
+
+# Window procedure signature; LRESULT is LONG_PTR, pointer-sized like LPARAM
+LRESULT = wintypes.LPARAM
+WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+
+# Private user32 handle with the calls we make prototyped once at import, so each call
+# converts arguments directly; use_last_error makes ctypes.get_last_error() meaningful
+user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+# 32-bit user32 has no ...Ptr export; SetWindowLongW is the same call there
+SetWindowLongPtrW = getattr(user32, "SetWindowLongPtrW", None) or user32.SetWindowLongW
+
+user32.GetRawInputData.argtypes = [
+    wintypes.HANDLE, wintypes.UINT, ctypes.c_void_p, ctypes.POINTER(wintypes.UINT), wintypes.UINT
+]
+user32.GetRawInputData.restype = wintypes.UINT
+user32.RegisterRawInputDevices.argtypes = [ctypes.POINTER(RAWINPUTDEVICE), wintypes.UINT, wintypes.UINT]
+user32.RegisterRawInputDevices.restype = wintypes.BOOL
+SetWindowLongPtrW.argtypes = [wintypes.HWND, ctypes.c_int, LRESULT]
+SetWindowLongPtrW.restype = LRESULT
+user32.CallWindowProcW.argtypes = [LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+user32.CallWindowProcW.restype = LRESULT
+
+# Header size passed to every GetRawInputData call and offset of the record data, computed once
+RAWINPUTHEADER_SIZE = ctypes.sizeof(RAWINPUTHEADER)
+
+# Raw input is read into one persistent buffer; mouse and keyboard records always fit
+RAW_INPUT_BUFFER_SIZE = 1024
+RAW_INPUT_ERROR = 0xFFFFFFFF  # (UINT)-1, returned when the record does not fit
+
+# Decoders for the fixed layouts at the front of the buffer: the header's dwType, and
+# RAWMOUSE (usFlags, 2 pad bytes, usButtonFlags, usButtonData, ulRawButtons, lLastX, lLastY, ulExtraInformation)
+DWORD_STRUCT = struct.Struct("<I")
+RAWMOUSE_STRUCT = struct.Struct("<H2xHHIiiI")
+
 class ImprovedRawInputReader:
-    def __init__(self):
-        self.user32 = ctypes.windll.user32
+    def __init__(self, capture_keyboard=False, capture_hid=False):
+        self.user32 = user32
         self.kernel32 = ctypes.windll.kernel32
+        self._GetRawInputData = user32.GetRawInputData  # Hot path: one attribute load per call
         self.running = False
         self.callback = None
+        self._stop_event = threading.Event()  # Set once shutdown has been requested
+        
+        # Mouse is always captured; other devices only when a consumer wants them
+        self.capture_keyboard = capture_keyboard
+        self.capture_hid = capture_hid
         
-        # Statistics
-        self.total_mouse_x = 0
-        self.total_mouse_y = 0
-        self.mouse_clicks = 0
-        self.mouse_wheel_delta = 0
+        # Statistics (mouse totals live in one int64 array updated by the update_mouse kernel)
+        self._stats = np.zeros(5, dtype=np.int64)
+        self._stats_dirty = False  # Set by mark_stats_dirty, cleared when the label is rebuilt
         self.key_presses = 0
         self.last_key = None
         self.hid_data_count = 0
+        self.skipped_reports = 0
         
         # Tkinter window for proper message handling
         self.root = None
         self.hwnd = None
+        self._old_proc = None
+        self._new_proc = None
+        
+        # Persistent raw input buffer, reused for every WM_INPUT
+        self._buf = (ctypes.c_ubyte * RAW_INPUT_BUFFER_SIZE)()
+        self._buf_size = wintypes.UINT(RAW_INPUT_BUFFER_SIZE)
+        self._buf_size_ref = ctypes.byref(self._buf_size)
+        
+        # Event timestamps are integer microseconds since the reader was created
+        self._clock = time.perf_counter_ns
+        self._t0_ns = self._clock()
+        
+        # Record decoders indexed by RAWINPUTHEADER.dwType (RIM_TYPEMOUSE, RIM_TYPEKEYBOARD, RIM_TYPEHID)
+        self._dispatch = (self.make_mouse_decoder(), self.decode_keyboard_record, self.decode_hid_record)
         
     def set_callback(self, callback_func):
         """Set callback function to handle raw input data"""
@@ -151,13 +243,13 @@ class ImprovedRawInputReader:
         self.stats_label.pack(side='bottom', padx=10, pady=10)
         
         # Bind window close
-        self.root.protocol("WM_DELETE_WINDOW", self.stop)
+        self.root.protocol("WM_DELETE_WINDOW", self.close_window)
         
         print(f"✅ Created window with handle: 0x{self.hwnd:08X}")
         return True
         
-    def register_devices(self):
-        """Register for raw input with window handle"""
+    def register_devices(self, mouse=True, keyboard=False, hid=False):
+        """Register only the requested device classes for raw input, in one call"""
         if not self.hwnd:
             print("❌ No window handle available for registration")
             return False
@@ -165,36 +257,33 @@ class ImprovedRawInputReader:
         print("🔧 Registering raw input devices with window handle...")
         
         try:
-            # Mouse device
-            mouse_device = RAWINPUTDEVICE()
-            mouse_device.usUsagePage = 0x01  # Generic Desktop
-            mouse_device.usUsage = 0x02      # Mouse
-            mouse_device.dwFlags = RIDEV_INPUTSINK
-            mouse_device.hwndTarget = self.hwnd
-            
+            # Collect the usages of every requested class into one device array
+            names = []
+            usages = []
+            for name, class_usages, wanted in (
+                ("mouse", MOUSE_USAGES, mouse),
+                ("keyboard", KEYBOARD_USAGES, keyboard),
+                ("HID", HID_USAGES, hid),
+            ):
+                if wanted:
+                    names.append(name)
+                    usages.extend(class_usages)
+            if not usages:
+                return True
+                
+            devices = (RAWINPUTDEVICE * len(usages))()
+            for device, (usage_page, usage) in zip(devices, usages):
+                device.usUsagePage = usage_page
+                device.usUsage = usage
+                device.dwFlags = RIDEV_INPUTSINK
+                device.hwndTarget = self.hwnd
+                
             result = self.user32.RegisterRawInputDevices(
-                ctypes.byref(mouse_device), 1, ctypes.sizeof(RAWINPUTDEVICE)
+                devices, len(usages), ctypes.sizeof(RAWINPUTDEVICE)
             )
             
             if result:
-                print("✅ Successfully registered mouse for raw input")
-                
-                # Try keyboard too
-                keyboard_device = RAWINPUTDEVICE()
-                keyboard_device.usUsagePage = 0x01  # Generic Desktop
-                keyboard_device.usUsage = 0x06      # Keyboard
-                keyboard_device.dwFlags = RIDEV_INPUTSINK
-                keyboard_device.hwndTarget = self.hwnd
-                
-                kb_result = self.user32.RegisterRawInputDevices(
-                    ctypes.byref(keyboard_device), 1, ctypes.sizeof(RAWINPUTDEVICE)
-                )
-                
-                if kb_result:
-                    print("✅ Successfully registered keyboard for raw input")
-                else:
-                    print("⚠️  Keyboard registration failed, but mouse should work")
-                    
+                print(f"✅ Successfully registered {', '.join(names)} for raw input")
                 return True
             else:
                 error_code = ctypes.get_last_error()
@@ -205,156 +294,195 @@ class ImprovedRawInputReader:
             print(f"❌ Registration exception: {e}")
             return False
             
+    def install_window_proc(self):
+        """Subclass the Tk window so WM_INPUT is handed straight to process_raw_input"""
+        call_window_proc = self.user32.CallWindowProcW
+        
+        def wnd_proc(hwnd, msg, wParam, lParam):
+            if msg == WM_INPUT:
+                self.process_raw_input(lParam)
+            # Tk's own procedure still sees every message (WM_INPUT needs its default cleanup)
+            return call_window_proc(self._old_proc, hwnd, msg, wParam, lParam)
+            
+        # The trampoline must stay referenced for as long as it is installed
+        self._new_proc = WNDPROC(wnd_proc)
+        self._old_proc = SetWindowLongPtrW(
+            self.hwnd, GWLP_WNDPROC, ctypes.cast(self._new_proc, ctypes.c_void_p).value
+        )
+        
+        if not self._old_proc:
+            print(f"❌ Failed to install window procedure. Error: {ctypes.get_last_error()}")
+            self._new_proc = None
+            return False
+            
+        print("✅ Installed WM_INPUT window procedure")
+        return True
+        
+    def remove_window_proc(self):
+        """Restore Tk's original window procedure"""
+        if self._old_proc:
+            SetWindowLongPtrW(self.hwnd, GWLP_WNDPROC, self._old_proc)
+            self._old_proc = None
+            
     def process_raw_input(self, lParam):
         """Process raw input message"""
         try:
-            # Get the size of raw input data
-            size = wintypes.UINT()
-            self.user32.GetRawInputData(
-                lParam, 
-                0x10000003,  # RID_INPUT
-                None, 
-                ctypes.byref(size), 
-                ctypes.sizeof(RAWINPUTHEADER)
-            )
-            
-            # Allocate buffer and get the data
-            buffer = ctypes.create_string_buffer(size.value)
-            result = self.user32.GetRawInputData(
+            # Fetch straight into the persistent buffer, no sizing call or allocation
+            self._buf_size.value = RAW_INPUT_BUFFER_SIZE
+            result = self._GetRawInputData(
                 lParam,
-                0x10000003,  # RID_INPUT
-                buffer,
-                ctypes.byref(size),
-                ctypes.sizeof(RAWINPUTHEADER)
+                RID_INPUT,
+                self._buf,
+                self._buf_size_ref,
+                RAWINPUTHEADER_SIZE
             )
             
-            if result != size.value:
+            if result == 0:
+                return
+            if result == RAW_INPUT_ERROR:
+                # Oversized HID report, larger than the buffer: skip it
+                self.skipped_reports += 1
                 return
                 
-            # Parse the raw input
-            raw_input = ctypes.cast(buffer, ctypes.POINTER(RAWINPUT)).contents
-            
-            if raw_input.header.dwType == RIM_TYPEMOUSE:
-                self.process_mouse_data(raw_input.data.mouse)
-            elif raw_input.header.dwType == RIM_TYPEKEYBOARD:
-                self.process_keyboard_data(raw_input.data.keyboard)
-            elif raw_input.header.dwType == RIM_TYPEHID:
-                self.process_hid_data(raw_input.data.hid, raw_input.header.hDevice)
+            # One table lookup picks the decoder; every event it produces shares one timestamp
+            (raw_type,) = DWORD_STRUCT.unpack_from(self._buf, 0)
+            if raw_type <= RIM_TYPEHID:
+                self._dispatch[raw_type]((self._clock() - self._t0_ns) // 1000)
                 
         except Exception as e:
             print(f"Error processing raw input: {e}")
             
-    def process_mouse_data(self, mouse_data):
-        """Process raw mouse input data"""
-        # Mouse movement
-        if mouse_data.lLastX != 0 or mouse_data.lLastY != 0:
-            self.total_mouse_x += mouse_data.lLastX
-            self.total_mouse_y += mouse_data.lLastY
+    def make_mouse_decoder(self):
+        """Build the RAWMOUSE decoder, specialized to this reader's buffer and header offset"""
+        unpack = RAWMOUSE_STRUCT.unpack_from
+        buf = self._buf
+        offset = RAWINPUTHEADER_SIZE
+        process = self.process_mouse_data
+        
+        def decode_mouse_record(ts):
+            flags, button_flags, button_data, _, delta_x, delta_y, _ = unpack(buf, offset)
+            process(flags, button_flags, button_data, delta_x, delta_y, ts)
             
-            data = {
+        return decode_mouse_record
+        
+    def decode_keyboard_record(self, ts):
+        """Process the RAWKEYBOARD record in the buffer through a view, without copying"""
+        self.process_keyboard_data(RAWKEYBOARD.from_buffer(self._buf, RAWINPUTHEADER_SIZE), ts)
+        
+    def decode_hid_record(self, ts):
+        """Process the RAWHID record in the buffer through a view, without copying"""
+        header = RAWINPUTHEADER.from_buffer(self._buf)
+        self.process_hid_data(RAWHID.from_buffer(self._buf, RAWINPUTHEADER_SIZE), header.hDevice, ts)
+        
+    def process_mouse_data(self, flags, button_flags, button_data, delta_x, delta_y, ts):
+        """Process raw mouse input data (RAWMOUSE fields already decoded to ints)"""
+        # Accumulate in the kernel; event dicts are only built for a callback
+        stats = self._stats
+        kind, wheel_delta, button = update_mouse(stats, delta_x, delta_y, button_flags, button_data)
+        if kind and not self._stats_dirty:
+            self.mark_stats_dirty()
+        callback = self.callback
+        if callback is None:
+            return
+            
+        # Mouse movement
+        if kind & MOUSE_EVENT_MOVE:
+            callback({
                 'type': 'mouse_move',
-                'delta_x': mouse_data.lLastX,
-                'delta_y': mouse_data.lLastY,
-                'total_x': self.total_mouse_x,
-                'total_y': self.total_mouse_y,
-                'flags': mouse_data.usFlags,
-                'timestamp': time.time()
-            }
+                'delta_x': delta_x,
+                'delta_y': delta_y,
+                'total_x': int(stats[MOUSE_TOTAL_X]),
+                'total_y': int(stats[MOUSE_TOTAL_Y]),
+                'flags': flags,
+                'timestamp': ts
+            })
             
-            if self.callback:
-                self.callback(data)
-                
-        # Mouse buttons
-        button_flags = mouse_data.usButtonFlags
-        if button_flags:
-            self.mouse_clicks += 1
-            button_name = "Unknown"
-            button_state = "Unknown"
+        # Mouse wheel
+        if kind & MOUSE_EVENT_WHEEL:
+            callback({
+                'type': 'mouse_wheel',
+                'delta': int(wheel_delta),
+                'total_delta': int(stats[MOUSE_WHEEL_TOTAL]),
+                'timestamp': ts
+            })
             
-            if button_flags & RI_MOUSE_LEFT_BUTTON_DOWN:
-                button_name, button_state = "Left", "Down"
-            elif button_flags & RI_MOUSE_LEFT_BUTTON_UP:
-                button_name, button_state = "Left", "Up"
-            elif button_flags & RI_MOUSE_RIGHT_BUTTON_DOWN:
-                button_name, button_state = "Right", "Down"
-            elif button_flags & RI_MOUSE_RIGHT_BUTTON_UP:
-                button_name, button_state = "Right", "Up"
-            elif button_flags & RI_MOUSE_MIDDLE_BUTTON_DOWN:
-                button_name, button_state = "Middle", "Down"
-            elif button_flags & RI_MOUSE_MIDDLE_BUTTON_UP:
-                button_name, button_state = "Middle", "Up"
-            elif button_flags & RI_MOUSE_WHEEL:
-                wheel_delta = ctypes.c_short(mouse_data.usButtonData).value
-                self.mouse_wheel_delta += wheel_delta
-                data = {
-                    'type': 'mouse_wheel',
-                    'delta': wheel_delta,
-                    'total_delta': self.mouse_wheel_delta,
-                    'timestamp': time.time()
-                }
-                if self.callback:
-                    self.callback(data)
-                return
-                
-            data = {
+        # Mouse buttons
+        elif kind & MOUSE_EVENT_BUTTON:
+            if button >= 0:
+                _, button_name, button_state = BUTTON_TABLE[button]
+            else:
+                button_name = button_state = "Unknown"
+            callback({
                 'type': 'mouse_button',
                 'button': button_name,
                 'state': button_state,
-                'click_count': self.mouse_clicks,
-                'timestamp': time.time()
-            }
-            
-            if self.callback:
-                self.callback(data)
+                'click_count': int(stats[MOUSE_CLICKS]),
+                'timestamp': ts
+            })
                 
-    def process_keyboard_data(self, keyboard_data):
+    def process_keyboard_data(self, keyboard_data, ts):
         """Process raw keyboard input data"""
-        self.key_presses += 1
-        self.last_key = keyboard_data.VKey
+        # Read each ctypes field once; every access is a descriptor call
+        vkey = keyboard_data.VKey
+        key_presses = self.key_presses + 1
+        self.key_presses = key_presses
+        self.last_key = vkey
+        if not self._stats_dirty:
+            self.mark_stats_dirty()
+        callback = self.callback
+        if callback is None:
+            return
         
-        key_state = "Down" if not (keyboard_data.Flags & 0x01) else "Up"
+        key_flags = keyboard_data.Flags
+        key_state = "Down" if not (key_flags & 0x01) else "Up"
         
-        data = {
+        callback({
             'type': 'keyboard',
-            'vkey': keyboard_data.VKey,
+            'vkey': vkey,
             'scan_code': keyboard_data.MakeCode,
-            'flags': keyboard_data.Flags,
+            'flags': key_flags,
             'state': key_state,
-            'key_count': self.key_presses,
-            'timestamp': time.time()
-        }
-        
-        if self.callback:
-            self.callback(data)
+            'key_count': key_presses,
+            'timestamp': ts
+        })
             
-    def process_hid_data(self, hid_data, device_handle):
+    def process_hid_data(self, hid_data, device_handle, ts):
         """Process raw HID device data"""
-        self.hid_data_count += 1
+        data_count = self.hid_data_count + 1
+        self.hid_data_count = data_count
+        callback = self.callback
+        if callback is None:
+            return
         
-        # Extract raw bytes
-        raw_bytes = []
-        for i in range(min(hid_data.dwSizeHid * hid_data.dwCount, 64)):
-            raw_bytes.append(hid_data.bRawData[i])
+        # Copy the report bytes out in one memcpy (bRawData is variable-length past the struct)
+        size = hid_data.dwSizeHid
+        count = hid_data.dwCount
+        raw_bytes = ctypes.string_at(ctypes.addressof(hid_data) + RAWHID.bRawData.offset, min(size * count, 64))
             
-        data = {
+        callback({
             'type': 'hid',
             'device_handle': device_handle,
-            'size': hid_data.dwSizeHid,
-            'count': hid_data.dwCount,
+            'size': size,
+            'count': count,
             'raw_bytes': raw_bytes,
-            'hex_data': ' '.join(f'{b:02X}' for b in raw_bytes),
-            'data_count': self.hid_data_count,
-            'timestamp': time.time()
-        }
-        
-        if self.callback:
-            self.callback(data)
+            'hex_data': raw_bytes.hex(' ').upper(),
+            'data_count': data_count,
+            'timestamp': ts
+        })
+            
+    def mark_stats_dirty(self):
+        """Flag the stats as changed and schedule one label refresh (runs on the Tk thread)"""
+        self._stats_dirty = True
+        if self.running and self.root:
+            self.root.after(STATS_REFRESH_MS, self.update_stats_display)
             
     def update_stats_display(self):
-        """Update the statistics display in the window"""
-        if self.stats_label and self.root:
+        """Update the statistics display in the window (only when the stats changed)"""
+        if self._stats_dirty and self.stats_label and self.root:
+            self._stats_dirty = False
             try:
-                stats_text = f"Mouse: Δ({self.total_mouse_x:+6d}, {self.total_mouse_y:+6d}) | Clicks: {self.mouse_clicks} | Keys: {self.key_presses}"
+                stats = self._stats
+                stats_text = f"Mouse: Δ({stats[MOUSE_TOTAL_X]:+6d}, {stats[MOUSE_TOTAL_Y]:+6d}) | Clicks: {stats[MOUSE_CLICKS]} | Keys: {self.key_presses}"
                 self.stats_label.config(text=stats_text)
             except:
                 pass  # Window might be closing
@@ -368,34 +496,22 @@ class ImprovedRawInputReader:
             return False
             
         # Register devices
-        if not self.register_devices():
+        if not self.register_devices(keyboard=self.capture_keyboard, hid=self.capture_hid):
             print("⚠️  Registration failed, but continuing...")
             
+        # Route WM_INPUT for our window into process_raw_input
+        self.install_window_proc()
+            
         print("🎯 Starting improved raw input capture...")
         print("   Move mouse over the window or press keys")
         print("   Close window or press Ctrl+C to stop")
         
-        # Custom event handler for WM_INPUT
-        def wm_input_handler(hwnd, msg, wParam, lParam):
-            if msg == WM_INPUT:
-                self.process_raw_input(lParam)
-                self.update_stats_display()
-            return self.user32.DefWindowProcW(hwnd, msg, wParam, lParam)
-        
-        # Register custom window procedure (this is complex, so we'll use polling instead)
-        def check_for_input():
-            if self.running and self.root:
-                # Update stats display
-                self.update_stats_display()
-                # Schedule next check
-                self.root.after(100, check_for_input)
-        
-        # Start checking for input
+        # No polling: raw input arrives through the window procedure, and the
+        # stats label refresh is scheduled only when an event changes the stats
         if self.root:
-            check_for_input()
-        
             try:
-                # Run the Tkinter main loop
+                # Run the Tkinter main loop until a stop request quits it
+                self.root.after(STOP_POLL_MS, self.poll_stop)
                 self.root.mainloop()
             except KeyboardInterrupt:
                 print("\n🛑 Stopping...")
@@ -404,28 +520,66 @@ class ImprovedRawInputReader:
         else:
             print("❌ Failed to create window")
             
+    def request_stop(self):
+        """Ask the Tk main loop to exit; safe to call repeatedly or from another thread"""
+        self._stop_event.set()  # Only sets the flag, poll_stop quits on the Tk thread
+        
+    def poll_stop(self):
+        """Quit the Tk main loop once a stop has been requested, otherwise check again later (Tk thread)"""
+        if not self.root:
+            return
+        if self._stop_event.is_set():
+            self.root.quit()
+        else:
+            self.root.after(STOP_POLL_MS, self.poll_stop)
+            
+    def close_window(self):
+        """Handle the window close button by quitting the Tk main loop right away (Tk thread)"""
+        self._stop_event.set()
+        self.root.quit()
+        
     def stop(self):
-        """Stop the raw input capture"""
+        """Stop the raw input capture and tear down the window (once mainloop has returned)"""
         self.running = False
-        if self.root:
+        self._stop_event.set()
+        root, self.root = self.root, None
+        if root:
             try:
-                self.root.quit()
-                self.root.destroy()
+                self.remove_window_proc()
+                root.destroy()
             except:
                 pass
-        print("👋 Raw input capture stopped.")
+            print("👋 Raw input capture stopped.")
+
+# Event log for improved_callback; main() routes it to the console through a background thread,
+# other callers without a handler attached get the lines printed directly
+event_log = logging.getLogger("improved_raw_input.events")
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread"""
+    def prepare(self, record):
+        return record
+
+def log_event(msg, *args):
+    """Write one event line through event_log once main() has set it up, else print it directly"""
+    if event_log.handlers:
+        event_log.info(msg, *args)
+    else:
+        print(msg % args)
 
 def improved_callback(data):
-    """Improved callback function to display raw input data"""
+    """Improved callback function to display raw input data (formatted off the input path under main())"""
     if data['type'] == 'mouse_move':
-        print(f"🖱️  Mouse: Δ({data['delta_x']:+4d}, {data['delta_y']:+4d}) → Total({data['total_x']:6d}, {data['total_y']:6d})")
+        log_event("🖱️  Mouse: Δ(%+4d, %+4d) → Total(%6d, %6d)",
+                  data['delta_x'], data['delta_y'], data['total_x'], data['total_y'])
     elif data['type'] == 'mouse_button':
-        print(f"🖱️  Mouse: {data['button']} {data['state']} (Click #{data['click_count']})")
+        log_event("🖱️  Mouse: %s %s (Click #%d)", data['button'], data['state'], data['click_count'])
     elif data['type'] == 'mouse_wheel':
-        print(f"🖱️  Mouse: Wheel Δ{data['delta']:+4d} → Total{data['total_delta']:+6d}")
+        log_event("🖱️  Mouse: Wheel Δ%+4d → Total%+6d", data['delta'], data['total_delta'])
     elif data['type'] == 'keyboard':
-        key_name = f"VK_{data['vkey']:02X}" if data['vkey'] < 256 else "Unknown"
-        print(f"⌨️  Keyboard: {key_name} {data['state']} (Scan: {data['scan_code']}, Press #{data['key_count']})")
+        key_name = VK_NAMES[data['vkey']] if data['vkey'] < 256 else "Unknown"
+        log_event("⌨️  Keyboard: %s %s (Scan: %d, Press #%d)",
+                  key_name, data['state'], data['scan_code'], data['key_count'])
 
 def main():
     """Main function to run the improved raw input reader"""
@@ -433,9 +587,20 @@ def main():
     print("   This version creates a proper window for message handling")
     print()
     
-    reader = ImprovedRawInputReader()
-    reader.set_callback(improved_callback)
-    reader.run()
+    # Event lines are queued and written by a listener thread, so a slow console never stalls WM_INPUT
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    event_log.addHandler(DeferredQueueHandler(log_queue))
+    event_log.setLevel(logging.INFO)
+    event_log.propagate = False
+    listener.start()
+    
+    try:
+        reader = ImprovedRawInputReader(capture_keyboard=True)
+        reader.set_callback(improved_callback)
+        reader.run()
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -12,25 +12,87 @@ from kivy.uix.widget import Widget
 from kivy.uix.button import Button
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
-from kivy.graphics import Line, Color, Ellipse
+from kivy.graphics import Line, Color, Ellipse, Mesh, RenderContext
 from kivy.clock import Clock
 from kivy.core.window import Window
 import time
 import math
+from collections import deque
+import numpy as np
+from tracker_kernels import trail_fans
+
+# Trail shader: each vertex carries its own fade alpha, so the whole trail is one draw
+TRAIL_VERTEX_SHADER = '''
+$HEADER$
+attribute float vAlpha;
+varying float trail_alpha;
+
+void main(void) {
+    trail_alpha = vAlpha;
+    gl_Position = projection_mat * modelview_mat * vec4(vPosition.xy, 0.0, 1.0);
+}
+'''
+
+TRAIL_FRAGMENT_SHADER = '''
+$HEADER$
+varying float trail_alpha;
+
+void main(void) {
+    gl_FragColor = vec4(1.0, 0.6, 0.6, trail_alpha * 0.8);  // Fading light red
+}
+'''
 
 class TouchTracker(Widget):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
         # Touch tracking variables
-        self.touch_positions = []
-        self.trail_positions = []
         self.max_trail_length = 20
         self.max_history_points = 300
+        self.trail_positions = deque(maxlen=self.max_trail_length)
+        
+        # Touch history as a numpy ring buffer
+        self.history_points = np.zeros((self.max_history_points, 2), dtype=np.float32)
+        self.history_count = 0
+        self.history_index = 0
         
         # Visual settings
         self.pointer_radius = 15
         
+        # History segments are drawn as one polyline per alpha bucket
+        self.history_alpha_buckets = 8
+        
+        # Trail circles are tessellated into triangle fans and drawn as a single Mesh
+        self.trail_segments = 8
+        angles = np.linspace(0, 2 * np.pi, self.trail_segments, endpoint=False)
+        self._trail_ring = np.column_stack((np.cos(angles), np.sin(angles))).astype(np.float32)
+        
+        # Scratch arrays the trail_fans kernel fills in place every frame
+        self._trail_xy = np.zeros((self.max_trail_length, 2), dtype=np.float32)
+        self._trail_verts = np.zeros(self.max_trail_length * (self.trail_segments + 1) * 3, dtype=np.float32)
+        self._trail_idx = np.zeros(self.max_trail_length * self.trail_segments * 3, dtype=np.int32)
+        
+        # Retained canvas instructions, created once and updated in place every frame
+        with self.canvas:
+            self._trail_context = RenderContext(use_parent_projection=True, use_parent_modelview=True)
+            self._history_lines = []
+            for b in range(self.history_alpha_buckets):
+                alpha = (b + 1) / self.history_alpha_buckets
+                Color(0, 0.824, 0.827, alpha)  # Cyan with varying alpha
+                self._history_lines.append(Line(points=[], width=max(1, int(3 * alpha))))
+            self._pointer_color = Color(1, 0.278, 0.341, 1)  # Red
+            self._pointer = Ellipse(pos=(0, 0), size=(0, 0))
+            self._crosshair_color = Color(1, 0.278, 0.341, 0.5)  # Semi-transparent red
+            self._ch_h = Line(points=[], width=1)
+            self._ch_v = Line(points=[], width=1)
+        self._trail_context.shader.vs = TRAIL_VERTEX_SHADER
+        self._trail_context.shader.fs = TRAIL_FRAGMENT_SHADER
+        with self._trail_context:
+            self._trail_mesh = Mesh(fmt=[(b'vPosition', 2, 'float'), (b'vAlpha', 1, 'float')],
+                                    mode='triangles')
+        self._history_dirty = False
+        self._dirty = False
+        
         # Control variables
         self.show_trail = True
         self.show_coordinates = True
@@ -43,17 +105,32 @@ class TouchTracker(Widget):
         self.total_distance = 0.0
         self.last_touch_pos = None
         
-        # Animation timer
-        Clock.schedule_interval(self.update_animation, 1/30.0)  # 30 FPS
+        # Move events are queued here and folded into the history once per frame
+        self._pending_moves = []
+        self._move_origin = None
+        
+        # Move logging is off by default; when enabled, moves are summarized once per second
+        self.verbose = False
+        self._move_log = []
+        
+        # Draw routine for the current toggles, see select_drawer
+        self.select_drawer()
+        
+        # Animation update runs once per rendered frame, right before the canvas is drawn
+        Clock.schedule_interval(self.update_animation, 0)
+        Clock.schedule_interval(self.flush_move_log, 1.0)
         
     def reset_history(self):
         """Reset all touch history and trails"""
-        self.touch_positions.clear()
+        self.history_count = 0
+        self.history_index = 0
         self.trail_positions.clear()
+        self._pending_moves.clear()
+        self._move_origin = self.last_touch_pos
         self.total_touches = 0
         self.total_distance = 0.0
-        if hasattr(self, 'canvas') and self.canvas:
-            self.canvas.clear()
+        self._history_dirty = True
+        self._dirty = True
         print("🧹 Touch history and trails reset!")
         
     def toggle_trail(self):
@@ -61,81 +138,123 @@ class TouchTracker(Widget):
         self.show_trail = not self.show_trail
         if not self.show_trail:
             self.trail_positions.clear()
+        self.select_drawer()
+        self._dirty = True
         status = "ON" if self.show_trail else "OFF"
         print(f"🎨 Trail animation: {status}")
         
     def toggle_lines(self):
         """Toggle line display"""
         self.show_lines = not self.show_lines
+        self._history_dirty = True
+        self.select_drawer()
+        self._dirty = True
         status = "ON" if self.show_lines else "OFF"
         print(f"� Line display: {status}")
         
     def toggle_coordinates(self):
         """Toggle coordinates display"""
         self.show_coordinates = not self.show_coordinates
+        self.select_drawer()
+        self._dirty = True
         status = "ON" if self.show_coordinates else "OFF"
         print(f"📍 Coordinates display: {status}")
         
+    def add_history_points(self, points):
+        """Append an (n, 2) batch of touch positions to the history ring buffer"""
+        points = np.asarray(points, dtype=np.float32)[-self.max_history_points:]
+        n = len(points)
+        slots = (self.history_index + np.arange(n)) % self.max_history_points
+        self.history_points[slots] = points
+        self.history_index = (self.history_index + n) % self.max_history_points
+        self.history_count = min(self.history_count + n, self.max_history_points)
+        self._history_dirty = True
+        
+    def ordered_history(self):
+        """Return the touch history oldest first as an (n, 2) array"""
+        if self.history_count < self.max_history_points:
+            # Buffer not full yet, use from 0 to history_count
+            return self.history_points[:self.history_count]
+        # Buffer is full, arrange from oldest to newest
+        return np.concatenate([
+            self.history_points[self.history_index:],
+            self.history_points[:self.history_index]
+        ])
+        
     def on_touch_down(self, touch):
         """Handle touch down event"""
+        # Apply moves still queued from the previous touch before starting a new one
+        if self._pending_moves:
+            self.apply_pending_moves()
+            
         self.total_touches += 1
         self.current_touch_id = touch.id
         self.touch_start_time = time.time()
         self.last_touch_pos = touch.pos
+        self._move_origin = touch.pos
         
         # Add to position history
-        self.touch_positions.append(touch.pos)
+        self.add_history_points([touch.pos])
         
         # Add to trail
         if self.show_trail:
             self.trail_positions.append(touch.pos)
-            if len(self.trail_positions) > self.max_trail_length:
-                self.trail_positions.pop(0)
                 
+        self._dirty = True
         print(f"🎯 Touch DOWN at ({touch.x:.0f}, {touch.y:.0f}) | Touch #{self.total_touches}")
         return True
         
     def on_touch_move(self, touch):
         """Handle touch move event - Core functionality"""
         if touch.id == self.current_touch_id:
-            # Calculate distance moved
-            if self.last_touch_pos:
-                dx = touch.x - self.last_touch_pos[0]
-                dy = touch.y - self.last_touch_pos[1]
-                distance = math.sqrt(dx*dx + dy*dy)
-                self.total_distance += distance
+            # Ignore sub-pixel jitter
+            last = self.last_touch_pos
+            if last and math.hypot(touch.x - last[0], touch.y - last[1]) < 0.5:
+                return True
                 
+            # Queue the move; history, trail and distance are updated on the next frame
             self.last_touch_pos = touch.pos
-            
-            # Add to position history
-            self.touch_positions.append(touch.pos)
-            if len(self.touch_positions) > self.max_history_points:
-                self.touch_positions.pop(0)
-                
-            # Add to trail
-            if self.show_trail:
-                self.trail_positions.append(touch.pos)
-                if len(self.trail_positions) > self.max_trail_length:
-                    self.trail_positions.pop(0)
+            self._pending_moves.append(touch.pos)
+            self._dirty = True
                     
-            # Print movement data with delta information
-            delta_info = ""
-            if len(self.touch_positions) > 1:
-                prev_pos = self.touch_positions[-2]
-                delta_x = touch.x - prev_pos[0]
-                delta_y = touch.y - prev_pos[1]
-                delta_info = f" | Δ({delta_x:+.0f}, {delta_y:+.0f})"
+            # Buffer movement data for the periodic log flush
+            if self.verbose:
+                self._move_log.append((touch.x, touch.y))
                 
-            print(f"🖱️  Touch MOVE at ({touch.x:.0f}, {touch.y:.0f}){delta_info} | Total Distance: {self.total_distance:.1f}px")
-            
         return True
         
+    def apply_pending_moves(self):
+        """Fold all queued move events into the distance, history and trail at once"""
+        moves = self._pending_moves
+        path = np.array([self._move_origin] + moves, dtype=np.float64)
+        steps = np.diff(path, axis=0)
+        self.total_distance += float(np.hypot(steps[:, 0], steps[:, 1]).sum())
+        self._move_origin = moves[-1]
+        
+        # Add to position history
+        self.add_history_points(path[1:])
+        
+        # Add to trail
+        if self.show_trail:
+            self.trail_positions.extend(moves)
+        moves.clear()
+        
+    def flush_move_log(self, dt):
+        """Print a summary of the touch moves buffered since the last flush"""
+        if not self._move_log:
+            return
+        x, y = self._move_log[-1]
+        print(f"🖱️  {len(self._move_log)} touch moves | Last at ({x:.0f}, {y:.0f}) | Total Distance: {self.total_distance:.1f}px")
+        self._move_log.clear()
+        
     def on_touch_up(self, touch):
         """Handle touch up event"""
         if touch.id == self.current_touch_id:
+            if self._pending_moves:
+                self.apply_pending_moves()
             duration = time.time() - self.touch_start_time if self.touch_start_time else 0
             print(f"✋ Touch UP at ({touch.x:.0f}, {touch.y:.0f}) | Duration: {duration:.2f}s | Total Distance: {self.total_distance:.1f}px")
-            print(f"📊 Session Stats: {len(self.touch_positions)} points recorded")
+            print(f"📊 Session Stats: {self.history_count} points recorded")
             
             self.current_touch_id = None
             self.touch_start_time = None
@@ -144,65 +263,90 @@ class TouchTracker(Widget):
         
     def update_animation(self, dt):
         """Update animations and redraw"""
-        # Redraw if we have touch data
-        if self.touch_positions or self.trail_positions:
-            self.draw_touch_visualization()
+        # Nothing changed since the last frame
+        if not self._dirty:
+            return
+        if self._pending_moves:
+            self.apply_pending_moves()
+        self._draw()
+        self._dirty = False
             
-    def draw_touch_visualization(self):
-        """Draw all touch visualizations"""
-        if not hasattr(self, 'canvas') or not self.canvas:
+    def build_trail_mesh(self):
+        """Tessellate the trail circles into the trail mesh, mutating it in place"""
+        if not (self.show_trail and self.trail_positions):
+            self._trail_mesh.vertices = []
+            self._trail_mesh.indices = []
             return
             
-        try:
-            self.canvas.clear()
+        count = len(self.trail_positions)
+        self._trail_xy[:count] = self.trail_positions
+        trail_fans(self._trail_xy, count, self._trail_ring, self.pointer_radius,
+                   self._trail_verts, self._trail_idx)
+        self._trail_mesh.vertices = self._trail_verts[:count * (self.trail_segments + 1) * 3].tolist()
+        self._trail_mesh.indices = self._trail_idx[:count * self.trail_segments * 3].tolist()
             
-            with self.canvas:
-                # Draw trail with fade effect
-                if self.show_trail and self.trail_positions:
-                    for i, pos in enumerate(self.trail_positions):
-                        alpha = (i + 1) / len(self.trail_positions)
-                        trail_radius = self.pointer_radius * (0.3 + 0.7 * alpha)
-                        
-                        # Create fading color (light red)
-                        Color(1, 0.6, 0.6, alpha * 0.8)
-                        Ellipse(
-                            pos=(pos[0] - trail_radius, pos[1] - trail_radius),
-                            size=(trail_radius * 2, trail_radius * 2)
-                        )
-                        
-                # Draw touch history as connected lines
-                if self.show_lines and len(self.touch_positions) > 1:
-                    for i in range(len(self.touch_positions) - 1):
-                        alpha = (i + 1) / len(self.touch_positions)
-                        
-                        Color(0, 0.824, 0.827, alpha)  # Cyan with varying alpha
-                        Line(
-                            points=[
-                                self.touch_positions[i][0], self.touch_positions[i][1],
-                                self.touch_positions[i+1][0], self.touch_positions[i+1][1]
-                            ],
-                            width=max(1, int(3 * alpha))
-                        )
-                        
-                # Draw current touch point and effects
-                if self.touch_positions:
-                    current_pos = self.touch_positions[-1]
-                    
-                    # Draw main touch point
-                    Color(1, 0.278, 0.341, 1)  # Red
-                    Ellipse(
-                        pos=(current_pos[0] - self.pointer_radius, current_pos[1] - self.pointer_radius),
-                        size=(self.pointer_radius * 2, self.pointer_radius * 2)
-                    )
-                    
-                    # Draw crosshair if enabled
-                    if self.show_coordinates:
-                        Color(1, 0.278, 0.341, 0.5)  # Semi-transparent red
-                        Line(points=[0, current_pos[1], self.width, current_pos[1]], width=1)
-                        Line(points=[current_pos[0], 0, current_pos[0], self.height], width=1)
-                        
-        except Exception as e:
-            print(f"Drawing error: {e}")
+    def build_history_lines(self):
+        """Split the history into one polyline per alpha bucket, mutating the lines in place"""
+        if not (self.show_lines and self.history_count > 1):
+            for line in self._history_lines:
+                line.points = []
+            return
+            
+        # Segment i has alpha (i + 1) / count, so each bucket is a contiguous run of segments
+        count = self.history_count
+        buckets = self.history_alpha_buckets
+        points = self.ordered_history()
+        segment_bucket = np.minimum(np.arange(1, count) * buckets // count, buckets - 1)
+        bounds = np.searchsorted(segment_bucket, np.arange(buckets + 1)).tolist()
+        for b, line in enumerate(self._history_lines):
+            first, end = bounds[b], bounds[b + 1]
+            # Segments first..end-1 span points first..end
+            line.points = points[first:end + 1].reshape(-1).tolist() if end > first else []
+            
+    def select_drawer(self):
+        """Bind self._draw to the cheapest draw routine for the current toggles"""
+        if self.show_trail or self.show_lines or self.show_coordinates:
+            self._draw = self.draw_touch_visualization
+            return
+            
+        # Only the pointer is visible: empty the other instructions once and take the fast path
+        self.build_trail_mesh()
+        self.build_history_lines()
+        self._ch_h.points = []
+        self._ch_v.points = []
+        self._draw = self.draw_pointer
+        
+    def draw_pointer(self):
+        """Move the pointer ellipse to the latest touch position"""
+        if self.history_count:
+            x, y = self.history_points[self.history_index - 1].tolist()
+            r = self.pointer_radius
+            self._pointer.pos = (x - r, y - r)
+            self._pointer.size = (r * 2, r * 2)
+        else:
+            self._pointer.size = (0, 0)
+            
+    def draw_touch_visualization(self):
+        """Draw all touch visualizations"""
+        # Draw trail with fade effect
+        self.build_trail_mesh()
+        
+        # Draw touch history as bucketed polylines, only rebuilt when points changed
+        if self._history_dirty:
+            self.build_history_lines()
+            self._history_dirty = False
+            
+        # Draw current touch point and effects
+        self.draw_pointer()
+        
+        # Draw crosshair if enabled
+        if self.show_coordinates and self.history_count:
+            x, y = self.history_points[self.history_index - 1].tolist()
+            self._ch_h.points = [0, y, self.width, y]
+            self._ch_v.points = [x, 0, x, self.height]
+        else:
+            self._ch_h.points = []
+            self._ch_v.points = []
 
 class ModernTouchApp(App):
     def build(self):
@@ -277,7 +421,7 @@ class ModernTouchApp(App):
         """Update statistics display"""
         tracker = self.touch_tracker
         active_status = "ACTIVE" if tracker.current_touch_id is not None else "IDLE"
-        stats_text = f"Touches: {tracker.total_touches} | Points: {len(tracker.touch_positions)} | Distance: {tracker.total_distance:.1f}px | Status: {active_status}"
+        stats_text = f"Touches: {tracker.total_touches} | Points: {tracker.history_count} | Distance: {tracker.total_distance:.1f}px | Status: {active_status}"
         self.stats_label.text = stats_text
         
     def on_keyboard_down(self, window, keycode, *args):
@@ -331,7 +475,7 @@ if __name__ == "__main__":
     print("  ESC - Exit Application")
     print()
     print("🔥 Touch the screen to start tracking!")
-    print("   Watch console for detailed movement data")
+    print("   Watch console for touch down/up summaries")
     print("=" * 50)
     
     ModernTouchApp().run()
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk
 import time
+from collections import deque
+import numpy as np
 
 class MouseCircleApp:
     def __init__(self):
@@ -29,24 +31,75 @@ class MouseCircleApp:
         )
         self.reset_button.place(x=10, y=10, width=100, height=30)
         
-        self.circle = None
         self.radius = 20
         self.anim_radius = 40
         self.anim_grow = True
-        self.trail_positions = []
         self.max_trail_length = 15
-        self.position_history = []
+        self.trail_positions = deque(maxlen=self.max_trail_length)
         self.max_history = 100
         
+        # Position history ring buffer: slot i % max_history holds the i-th recorded position,
+        # with window coordinates stored as separate compact int16 columns
+        self._hist_x = np.zeros(self.max_history, dtype=np.int16)
+        self._hist_y = np.zeros(self.max_history, dtype=np.int16)
+        self._hist_t = np.zeros(self.max_history, dtype=np.float64)
+        
+        # History display is refreshed incrementally, at most every 500 ms
+        self.max_history_lines = 50
+        self._hist_pending = False
+        self._hist_total = 0  # Positions recorded since the last clear, also the ring write head
+        self._hist_shown = 0  # _hist_total at the last display refresh
+        self._hist_lines = 0  # Position lines currently in the display
+        self._hist_display_on = False
+        
+        # Formatted "%H:%M:%S" timestamp, recomputed only when the second changes
+        self._ts_last = 0
+        self._ts_cached = ""
+        
         # Control variables
         self.show_trail = tk.BooleanVar(value=True)
         self.show_animation = tk.BooleanVar(value=True)
         self.show_history = tk.BooleanVar(value=False)
         
+        # Trail (radius, color) for each point, precomputed for every trail length
+        self._trail_styles = [[]]
+        for count in range(1, self.max_trail_length + 1):
+            styles = []
+            for i in range(count):
+                # Calculate trail properties (fade from back to front)
+                alpha = (i + 1) / count
+                
+                # Create color with opacity effect using different shades
+                if alpha < 0.3:
+                    color = '#E8E8E8'  # Very light gray
+                elif alpha < 0.6:
+                    color = '#B0B0B0'  # Light gray
+                else:
+                    color = '#808080'  # Medium gray
+                styles.append((self.radius * (0.3 + 0.7 * alpha), color))
+            self._trail_styles.append(styles)
+        
+        # Persistent canvas items, moved on every draw instead of recreated
+        self._canvas_path = str(self.canvas)
+        self._trail_items = [self.canvas.create_oval(0, 0, 0, 0, outline='', width=0, state='hidden')
+                             for _ in range(self.max_trail_length)]
+        self._trail_shown = 0
+        self._trail_fills = [None] * self.max_trail_length  # Shade currently set on each pooled oval
+        self._anim = self.canvas.create_oval(0, 0, 0, 0, fill='', outline='lightblue', width=4, state='hidden')
+        self.circle = self.canvas.create_oval(-100, -100, -100, -100, fill='blue', outline='black', width=2)
+        self._ch_h = self.canvas.create_line(0, -10, 0, -10, fill='red', width=2)
+        self._ch_v = self.canvas.create_line(-10, 0, -10, 0, fill='red', width=2)
+        self._coord_fmt = "({0}, {1})".format
+        self._coord_fmt_trail = "({0}, {1}) | Trail: {2}".format
+        self._last_text_key = None
+        self._coord_text = self.canvas.create_text(0, 0, text='', anchor='nw', font=('Arial', 14),
+                                                   fill='black', state='hidden')
+        
         self.root.bind('<Motion>', self.on_mouse_move)
         self.canvas.bind('<Configure>', self.on_resize)
         self.current_x = None
         self.current_y = None
+        self._drawn_state = None
         
         # Add keyboard shortcut to show control window
         self.root.bind('<F1>', lambda e: self.show_or_create_control_window())
@@ -59,7 +112,7 @@ class MouseCircleApp:
     def reset_trail_history(self):
         """Reset all trail positions and history data"""
         self.trail_positions.clear()
-        self.position_history.clear()
+        self._hist_total = 0
         
         # Visual feedback - briefly change button color
         original_bg = self.reset_button.cget('bg')
@@ -127,6 +180,7 @@ class MouseCircleApp:
         history_frame.pack(fill='both', expand=True, padx=20, pady=10)
         
         tk.Checkbutton(history_frame, text="Enable History Tracking", variable=self.show_history,
+                      command=self.update_history_display,
                       font=('Arial', 10), bg='lightgray').pack(anchor='w', padx=10, pady=5)
         
         # History display
@@ -172,9 +226,12 @@ class MouseCircleApp:
                 self.anim_radius -= 2
                 if self.anim_radius < 30:
                     self.anim_grow = True
-        # Redraw if mouse position is known
+        # Redraw if mouse position is known and the frame would differ from the last one
         if self.current_x is not None and self.current_y is not None:
-            self.draw_circle(self.current_x, self.current_y)
+            state = (self.current_x, self.current_y, self.anim_radius,
+                     self.show_trail.get(), self.show_animation.get())
+            if state != self._drawn_state:
+                self.draw_circle(self.current_x, self.current_y)
         self.root.after(30, self.animate)
 
     def on_mouse_move(self, event):
@@ -184,19 +241,19 @@ class MouseCircleApp:
         
         # Add current position to trail
         if self.show_trail.get():
-            self.trail_positions.append((x, y))
-            # Keep trail length limited
-            if len(self.trail_positions) > self.max_trail_length:
-                self.trail_positions.pop(0)
-        
-        # Add to history with timestamp
-        timestamp = time.strftime("%H:%M:%S")
-        self.position_history.append((x, y, timestamp))
-        if len(self.position_history) > self.max_history:
-            self.position_history.pop(0)
-        
-        # Update history display in control window
-        self.update_history_display()
+            self.trail_positions.append((x, y))  # Bounded by maxlen
+        
+        # Add to history with timestamp, formatted only when displayed or saved
+        slot = self._hist_total % self.max_history
+        self._hist_x[slot] = x
+        self._hist_y[slot] = y
+        self._hist_t[slot] = time.time()
+        self._hist_total += 1
+        
+        # Schedule a history display refresh in control window
+        if not self._hist_pending and self.show_history.get():
+            self._hist_pending = True
+            self.root.after(500, self.flush_history_display)
         
         self.draw_circle(x, y)
 
@@ -206,62 +263,65 @@ class MouseCircleApp:
             self.draw_circle(self.current_x, self.current_y)
 
     def draw_circle(self, x, y):
-        # Remove previous drawings
-        self.canvas.delete("all")
-        # Get current canvas size
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
-        
-        # Draw snake trail
-        if self.show_trail.get() and self.trail_positions:
-            for i, (trail_x, trail_y) in enumerate(self.trail_positions):
-                # Calculate trail properties (fade from back to front)
-                alpha = (i + 1) / len(self.trail_positions)
-                trail_radius = self.radius * (0.3 + 0.7 * alpha)
-                
-                # Create color with opacity effect using different shades
-                if alpha < 0.3:
-                    color = '#E8E8E8'  # Very light gray
-                elif alpha < 0.6:
-                    color = '#B0B0B0'  # Light gray
-                else:
-                    color = '#808080'  # Medium gray
-                
-                # Draw trail circle
-                self.canvas.create_oval(
-                    trail_x - trail_radius, trail_y - trail_radius,
-                    trail_x + trail_radius, trail_y + trail_radius,
-                    fill=color, outline='', width=0)
+        self._drawn_state = (x, y, self.anim_radius, self.show_trail.get(), self.show_animation.get())
         
-        # Draw animated circle behind the pointer
+        canvas = self.canvas
+        # Get current canvas size
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        
+        # Item updates are collected as Tcl commands and run in a single tk.eval
+        w = self._canvas_path
+        cmds = []
+        
+        # Draw snake trail on the pooled ovals, hiding the ones left over
+        shown = len(self.trail_positions) if self.show_trail.get() else 0
+        if shown:
+            styles = self._trail_styles[shown]
+            fills = self._trail_fills
+            for i, ((trail_x, trail_y), (trail_radius, color)) in enumerate(zip(self.trail_positions, styles)):
+                item = self._trail_items[i]
+                cmds.append(f"{w} coords {item} {trail_x - trail_radius} {trail_y - trail_radius} "
+                            f"{trail_x + trail_radius} {trail_y + trail_radius}")
+                # Shades only change while the trail grows, so a full trail sends none
+                if fills[i] != color:
+                    cmds.append(f"{w} itemconfigure {item} -fill {color}")
+                    fills[i] = color
+        for item in self._trail_items[self._trail_shown:shown]:
+            cmds.append(f"{w} itemconfigure {item} -state normal")
+        for item in self._trail_items[shown:self._trail_shown]:
+            cmds.append(f"{w} itemconfigure {item} -state hidden")
+        self._trail_shown = shown
+        
+        # Animated circle behind the pointer
         if self.show_animation.get():
-            self.canvas.create_oval(
-                x - self.anim_radius, y - self.anim_radius,
-                x + self.anim_radius, y + self.anim_radius,
-                fill='', outline='lightblue', width=4)
-        
-        # Draw circle at pointer
-        self.circle = self.canvas.create_oval(
-            x - self.radius, y - self.radius,
-            x + self.radius, y + self.radius,
-            fill='blue', outline='black', width=2)
-        
-        # Draw crosshair spanning the visible canvas
-        self.canvas.create_line(0, y, width, y, fill='red', width=2)
-        self.canvas.create_line(x, 0, x, height, fill='red', width=2)
-        
-        # Draw coordinates text in top left near the circle (pointer)
-        text_offset_x = -60  # left of the circle
-        text_offset_y = -30  # above the circle
-        coord_text = f"({x}, {y})"
-        
-        # Add trail count indicator
-        if self.trail_positions:
-            coord_text += f" | Trail: {len(self.trail_positions)}"
-        
-        self.canvas.create_text(x + text_offset_x, y + text_offset_y, 
-                               text=coord_text, anchor='nw', 
-                               font=('Arial', 14), fill='black')
+            r = self.anim_radius
+            cmds.append(f"{w} coords {self._anim} {x - r} {y - r} {x + r} {y + r}")
+            cmds.append(f"{w} itemconfigure {self._anim} -state normal")
+        else:
+            cmds.append(f"{w} itemconfigure {self._anim} -state hidden")
+        
+        # Circle at pointer
+        r = self.radius
+        cmds.append(f"{w} coords {self.circle} {x - r} {y - r} {x + r} {y + r}")
+        
+        # Crosshair spanning the visible canvas
+        cmds.append(f"{w} coords {self._ch_h} 0 {y} {width} {y}")
+        cmds.append(f"{w} coords {self._ch_v} {x} 0 {x} {height}")
+        
+        # Coordinates text in top left near the circle (pointer), only touched when it changes
+        text_key = (x, y, len(self.trail_positions))
+        if text_key != self._last_text_key:
+            self._last_text_key = text_key
+            text_offset_x = -60  # left of the circle
+            text_offset_y = -30  # above the circle
+            
+            # Add trail count indicator
+            coord_text = self._coord_fmt_trail(*text_key) if text_key[2] else self._coord_fmt(x, y)
+            
+            cmds.append(f"{w} coords {self._coord_text} {x + text_offset_x} {y + text_offset_y}")
+            cmds.append(f"{w} itemconfigure {self._coord_text} -text {{{coord_text}}} -state normal")
+        canvas.tk.eval("\n".join(cmds))
         
         # Ensure reset button stays on top
         self.reset_button.lift()
@@ -272,12 +332,13 @@ class MouseCircleApp:
 
     def reset_history_only(self):
         """Reset only position history, keep trail"""
-        self.position_history.clear()
+        self._hist_total = 0
         self.update_history_display()
         print("Position history cleared!")
 
     def save_history(self):
-        if not self.position_history:
+        count = self.history_size()
+        if not count:
             return
         
         try:
@@ -288,29 +349,81 @@ class MouseCircleApp:
                 title="Save Mouse Position History"
             )
             if filename:
+                xs, ys, stamps = self.recent_history(count)
+                fmt = self.format_timestamp
+                lines = "".join(f"{i:3d}: ({x:4d}, {y:4d}) at {fmt(t)}\n"
+                                for i, (x, y, t) in enumerate(zip(xs.tolist(), ys.tolist(), stamps.tolist()), 1))
                 with open(filename, 'w') as f:
-                    f.write("Mouse Position History\n")
-                    f.write("=" * 30 + "\n\n")
-                    for i, (x, y, timestamp) in enumerate(self.position_history, 1):
-                        f.write(f"{i:3d}: ({x:4d}, {y:4d}) at {timestamp}\n")
+                    f.write("Mouse Position History\n" + "=" * 30 + "\n\n" + lines)
         except Exception as e:
             print(f"Error saving history: {e}")
 
+    def history_size(self):
+        """Number of positions currently held in the history ring buffer"""
+        return min(self._hist_total, self.max_history)
+
+    def recent_history(self, count):
+        """Return the last `count` recorded positions oldest first as (x, y, timestamps) arrays"""
+        slots = np.arange(self._hist_total - count, self._hist_total) % self.max_history
+        return self._hist_x[slots], self._hist_y[slots], self._hist_t[slots]
+
+    def format_timestamp(self, t):
+        """Format a history timestamp as HH:MM:SS, reusing the string within the same second"""
+        second = int(t)
+        if second != self._ts_last:
+            self._ts_cached = time.strftime("%H:%M:%S", time.localtime(second))
+            self._ts_last = second
+        return self._ts_cached
+
+    def format_history_lines(self, count):
+        """Format the last `count` recorded positions, numbered in recording order"""
+        first = self._hist_total - count + 1
+        xs, ys, stamps = self.recent_history(count)
+        fmt = self.format_timestamp
+        return "".join(f"{first + i:2d}: ({x:4d}, {y:4d}) - {fmt(t)}\n"
+                       for i, (x, y, t) in enumerate(zip(xs.tolist(), ys.tolist(), stamps.tolist())))
+
+    def flush_history_display(self):
+        """Append the positions recorded since the last refresh to the history display"""
+        self._hist_pending = False
+        if not hasattr(self, 'history_text'):
+            return
+        if not (self._hist_display_on and self.show_history.get()):
+            self.update_history_display()
+            return
+        
+        new = min(self._hist_total - self._hist_shown, self.history_size(), self.max_history_lines)
+        if new <= 0:
+            return
+        self.history_text.insert(tk.END, self.format_history_lines(new))
+        self._hist_shown = self._hist_total
+        self._hist_lines += new
+        
+        # Drop the oldest position lines below the two header lines
+        excess = self._hist_lines - self.max_history_lines
+        if excess > 0:
+            self.history_text.delete("3.0", f"{3 + excess}.0")
+            self._hist_lines = self.max_history_lines
+        self.history_text.see(tk.END)
+
     def update_history_display(self):
         if hasattr(self, 'history_text'):
             self.history_text.delete(1.0, tk.END)
+            self._hist_shown = self._hist_total
             
-            if self.show_history.get() and self.position_history:
+            if self.show_history.get() and self._hist_total:
                 self.history_text.insert(tk.END, "Recent Mouse Positions:\n")
                 self.history_text.insert(tk.END, "-" * 30 + "\n")
                 
                 # Show last 50 positions
-                for i, (x, y, timestamp) in enumerate(self.position_history[-50:], 1):
-                    self.history_text.insert(tk.END, f"{i:2d}: ({x:4d}, {y:4d}) - {timestamp}\n")
+                self._hist_lines = min(self.max_history_lines, self.history_size())
+                self.history_text.insert(tk.END, self.format_history_lines(self._hist_lines))
+                self._hist_display_on = True
                 
                 self.history_text.see(tk.END)
             else:
                 self.history_text.insert(tk.END, "History tracking is disabled.\nCheck 'Enable History Tracking' to start.")
+                self._hist_display_on = False
 
     def run(self):
         self.root.mainloop()
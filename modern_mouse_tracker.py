@@ -3,6 +3,8 @@ from tkinter import ttk
 import time
 import math
 import numpy as np
+from collections import deque
+from tracker_kernels import history_groups
 
 class ModernMouseTracker:
     def __init__(self):
@@ -32,16 +34,17 @@ class ModernMouseTracker:
         # Mouse tracking variables
         self.current_x = None
         self.current_y = None
-        self.trail_positions = []
+        self.max_trail_length = 20
+        self.trail_positions = deque(maxlen=self.max_trail_length)
         
-        # Line history using numpy array for efficiency
+        # Line history using numpy array for efficiency. Every point is written twice, at
+        # history_index and history_index + max_history_points, so the points in order are
+        # always one contiguous slice of the doubled buffer
         self.max_history_points = 300
-        self.history_points = np.zeros((self.max_history_points, 2), dtype=np.float32)
+        self.history_points = np.zeros((2 * self.max_history_points, 2), dtype=np.float32)
         self.history_count = 0
         self.history_index = 0
         
-        self.max_trail_length = 20
-        
         # Animation variables
         self.grow_radius = 30
         self.grow_direction = 1
@@ -53,8 +56,17 @@ class ModernMouseTracker:
         self.show_line_history = True
         self.is_fullscreen = True
         
+        # Frame pacing: motion events only store the latest position, animate() records it
+        self.frame_interval_ms = 16
+        self.grow_speed = 2 / 30.0  # Grow circle speed in px per ms
+        self._last_frame_time = time.perf_counter()
+        self._pending_xy = None
+        self._last_drawn_xy = None
+        self._dirty = False
+        
         # Create modern UI elements
         self.create_modern_ui()
+        self.create_canvas_items()
         
         # Bind events
         self.root.bind('<Motion>', self.on_mouse_move)
@@ -198,6 +210,7 @@ class ModernMouseTracker:
         else:
             self.trail_button.config(text="Trail: OFF (T)", bg='#ff4757')
             self.trail_positions.clear()
+        self._dirty = True
             
     def toggle_grow(self):
         """Toggle grow animation on/off"""
@@ -206,6 +219,7 @@ class ModernMouseTracker:
             self.grow_button.config(text="Grow: ON (G)", bg='#2ed573')
         else:
             self.grow_button.config(text="Grow: OFF (G)", bg='#ff4757')
+        self._dirty = True
             
     def toggle_history(self):
         """Toggle line history on/off"""
@@ -215,6 +229,7 @@ class ModernMouseTracker:
         else:
             self.history_button.config(text="Lines: OFF (L)", bg='#ff4757')
             self.reset_history_points()
+        self._dirty = True
             
     def toggle_fullscreen(self):
         """Toggle fullscreen mode on/off"""
@@ -227,6 +242,11 @@ class ModernMouseTracker:
             self.root.geometry('800x600')  # Set windowed size
             self.fullscreen_button.config(text="Fullscreen: OFF (F)", bg='#ff4757')
             
+    def ordered_history_points(self):
+        """Return a view of the history points from oldest to newest"""
+        start = (self.history_index - self.history_count) % self.max_history_points
+        return self.history_points[start:start + self.history_count]
+        
     def reset_history_points(self):
         """Reset the history points array"""
         self.history_points.fill(0)
@@ -266,6 +286,7 @@ class ModernMouseTracker:
         """Reset all history and trails"""
         self.trail_positions.clear()
         self.reset_history_points()
+        self._dirty = True
         
         # Visual feedback
         original_bg = self.reset_button.cget('bg')
@@ -276,11 +297,15 @@ class ModernMouseTracker:
         
     def on_mouse_move(self, event):
         """Handle mouse movement"""
-        x, y = event.x, event.y
+        # Keep only the latest position; it is recorded once per frame in animate
+        self._pending_xy = (event.x, event.y)
         
+    def record_position(self, x, y):
+        """Record a mouse position in the history and trail"""
         # Store current position in history array
         if self.show_line_history:
-            self.history_points[self.history_index] = [x, y]
+            self.history_points[self.history_index] = x, y
+            self.history_points[self.history_index + self.max_history_points] = x, y
             self.history_index = (self.history_index + 1) % self.max_history_points
             if self.history_count < self.max_history_points:
                 self.history_count += 1
@@ -292,8 +317,6 @@ class ModernMouseTracker:
         # Add to trail
         if self.show_trail:
             self.trail_positions.append((x, y))
-            if len(self.trail_positions) > self.max_trail_length:
-                self.trail_positions.pop(0)
                 
     def on_mouse_click(self, event):
         """Handle mouse click - add special effect"""
@@ -308,117 +331,189 @@ class ModernMouseTracker:
             
     def animate(self):
         """Main animation loop"""
-        # Animate growing circle
+        frame_start = time.perf_counter()
+        elapsed_ms = min(100.0, (frame_start - self._last_frame_time) * 1000)
+        self._last_frame_time = frame_start
+        redraw = self._dirty
+        
+        # Animate growing circle, scaled by frame time so the speed doesn't depend on frame rate
         if self.show_grow_animation:
-            self.grow_radius += self.grow_direction * 2
+            self.grow_radius += self.grow_direction * self.grow_speed * elapsed_ms
             if self.grow_radius > 60:
                 self.grow_direction = -1
             elif self.grow_radius < 20:
                 self.grow_direction = 1
+            
+        # Record the latest mouse position once per frame
+        pending = self._pending_xy
+        if pending is not None and pending != (self.current_x, self.current_y):
+            self.record_position(*pending)
+            redraw = True
+            
+        if hasattr(self, 'click_effect'):
+            redraw = True
                 
-        # Draw everything only if mouse position is available
+        # Draw everything only if something besides the growing circle changed and mouse
+        # position is available; otherwise just move the growing circle
         if self.current_x is not None and self.current_y is not None:
-            self.draw_all()
+            if redraw or (self.current_x, self.current_y) != self._last_drawn_xy:
+                self._dirty = False
+                self.draw_all()
+            elif self.show_grow_animation:
+                self.draw_grow_circle()
             
-        # Schedule next frame
-        self.root.after(30, self.animate)
+        # Schedule next frame, taking off the time this one took
+        spent_ms = int((time.perf_counter() - frame_start) * 1000)
+        self.root.after(max(1, self.frame_interval_ms - spent_ms), self.animate)
+        
+    def create_canvas_items(self):
+        """Create the canvas items that draw_all moves and restyles every frame"""
+        canvas = self.canvas
+        
+        # History gradient colors by intensity, from dark to bright blue
+        self._color_palette = [f"#{i//3:02x}{i//2:02x}{i:02x}" for i in range(256)]
+        
+        # History segments are grouped by (intensity band, width) and each group is drawn
+        # as one polyline; 5 intensity bands and 3 widths give at most 7 groups
+        self.max_history_groups = 8
+        self._history_line_ids = [
+            canvas.create_line(0, 0, 0, 0, capstyle='round', joinstyle='round', state='hidden')
+            for _ in range(self.max_history_groups)
+        ]
+        self._history_styles = [None] * self.max_history_groups  # (fill, width) set on each line
+        self._history_shown = 0
+        
+        # Group bounds and styles written by the history_groups kernel
+        self._history_bounds = np.zeros(self.max_history_groups + 1, dtype=np.int64)
+        self._history_intensity = np.zeros(self.max_history_groups, dtype=np.int64)
+        self._history_widths = np.zeros(self.max_history_groups, dtype=np.int64)
+        
+        # Pool for the trail circles, hidden until used
+        self._canvas_path = str(canvas)
+        self._trail_ids = [
+            canvas.create_oval(0, 0, 0, 0, outline='', width=0, state='hidden')
+            for _ in range(self.max_trail_length)
+        ]
+        self._trail_fills = [None] * self.max_trail_length  # Fill last sent to each trail oval
+        self._trail_shown = 0
+        
+        # (radius, color) of each trail circle, by number of trail points shown
+        self._trail_styles = [None] + [
+            [self.trail_style((i + 1) / shown) for i in range(shown)]
+            for shown in range(1, self.max_trail_length + 1)
+        ]
+        
+        self._grow_id = canvas.create_oval(0, 0, 0, 0, outline='#00d2d3', width=3, fill='', state='hidden')
+        self._pointer_id = canvas.create_oval(0, 0, 0, 0, fill='#ff4757', outline='#ffffff', width=2, state='hidden')
+        self._crosshair_h = canvas.create_line(0, 0, 0, 0, fill='#ff4757', width=1, stipple='gray50', state='hidden')
+        self._crosshair_v = canvas.create_line(0, 0, 0, 0, fill='#ff4757', width=1, stipple='gray50', state='hidden')
+        self._text_bg_id = canvas.create_rectangle(0, 0, 0, 0, fill='#2b2b2b', outline='#ff4757', width=1, state='hidden')
+        self._text_id = canvas.create_text(0, 0, text='', anchor='w', font=('Segoe UI', 11), fill='#ffffff', state='hidden')
+        self._click_id = canvas.create_oval(0, 0, 0, 0, outline='#00d2d3', width=3, fill='', state='hidden')
+        
+        # Coordinate text formatters by (has trail, has points), called with the text state
+        # (x, y, trail length, history count); the text is only resent when that state changes
+        self._coord_formats = {
+            (has_trail, has_points): (
+                "Position: ({0}, {1})"
+                + (" | Trail: {2}" if has_trail else "")
+                + (" | Points: {3}" if has_points else "")
+            ).format
+            for has_trail in (False, True)
+            for has_points in (False, True)
+        }
+        self._last_text_state = None
         
     def draw_all(self):
         """Draw all visual elements"""
-        # Clear canvas
-        self.canvas.delete("all")
-        
         x, y = self.current_x, self.current_y
         
         # Return early if no mouse position yet
         if x is None or y is None:
             return
         
+        canvas = self.canvas
+        
         # Draw line history with gradient effect
+        groups = 0
         if self.show_line_history and self.history_count > 1:
-            # Get the points in order, handling circular buffer
-            if self.history_count < self.max_history_points:
-                # Buffer not full yet, use from 0 to history_count
-                points = self.history_points[:self.history_count]
-            else:
-                # Buffer is full, arrange from oldest to newest
-                points = np.concatenate([
-                    self.history_points[self.history_index:],
-                    self.history_points[:self.history_index]
-                ])
+            points = self.ordered_history_points()
             
-            # Draw lines between consecutive points
-            for i in range(len(points) - 1):
-                start = points[i]
-                end = points[i + 1]
-                
-                # Calculate alpha for gradient effect
-                alpha = (i + 1) / len(points)
-                
-                # Create color gradient from dark to bright blue
-                intensity = int(100 + (155 * alpha))
-                color = f"#{intensity//3:02x}{intensity//2:02x}{intensity:02x}"
-                
-                # Draw line with varying width
-                width = max(1, int(3 * alpha))
-                self.canvas.create_line(
-                    start[0], start[1], end[0], end[1],
-                    fill=color, width=width, capstyle='round'
-                )
-        
-        # Draw trail with fade effect
-        if self.show_trail and self.trail_positions:
-            for i, (trail_x, trail_y) in enumerate(self.trail_positions):
-                # Calculate fade effect
-                alpha = (i + 1) / len(self.trail_positions)
-                trail_radius = self.pointer_radius * (0.2 + 0.8 * alpha)
+            # Intensity and width only grow along the history, so each group is a contiguous
+            # run of segments
+            groups = history_groups(
+                len(points), 32, self._history_bounds, self._history_intensity, self._history_widths
+            )
+            bounds = self._history_bounds.tolist()
+            intensity = self._history_intensity.tolist()
+            widths = self._history_widths.tolist()
+            for g in range(groups):
+                first, end = bounds[g], bounds[g + 1]
+                line_id = self._history_line_ids[g]
                 
-                # Create gradient colors from transparent to solid
-                if alpha < 0.3:
-                    color = '#ffcccc'  # Very light red
-                elif alpha < 0.6:
-                    color = '#ff8888'  # Medium red
-                else:
-                    color = '#ff4444'  # Bright red
-                    
-                # Draw trail circle
-                self.canvas.create_oval(
-                    trail_x - trail_radius, trail_y - trail_radius,
-                    trail_x + trail_radius, trail_y + trail_radius,
-                    fill=color, outline='', width=0
-                )
+                # Segments first..end-1 span points first..end
+                canvas.coords(line_id, points[first:end + 1].ravel().tolist())
+                style = (self._color_palette[intensity[g]], widths[g])
+                if style != self._history_styles[g]:
+                    canvas.itemconfigure(line_id, fill=style[0], width=style[1])
+                    self._history_styles[g] = style
+            for line_id in self._history_line_ids[self._history_shown:groups]:
+                canvas.itemconfigure(line_id, state='normal')
+        for line_id in self._history_line_ids[groups:self._history_shown]:
+            canvas.itemconfigure(line_id, state='hidden')
+        self._history_shown = groups
+        
+        # Draw trail with fade effect; item updates are collected as Tcl commands and run
+        # in a single tk.eval
+        w = self._canvas_path
+        cmds = []
+        shown = len(self.trail_positions) if self.show_trail else 0
+        if shown:
+            fills = self._trail_fills
+            for i, ((trail_x, trail_y), (trail_radius, color)) in enumerate(
+                zip(self.trail_positions, self._trail_styles[shown])
+            ):
+                trail_id = self._trail_ids[i]
+                cmds.append(f"{w} coords {trail_id} {trail_x - trail_radius} {trail_y - trail_radius} "
+                            f"{trail_x + trail_radius} {trail_y + trail_radius}")
+                # Shades only change while the trail grows, so a full trail sends none
+                if fills[i] != color:
+                    cmds.append(f"{w} itemconfigure {trail_id} -fill {color}")
+                    fills[i] = color
+        for trail_id in self._trail_ids[self._trail_shown:shown]:
+            cmds.append(f"{w} itemconfigure {trail_id} -state normal")
+        for trail_id in self._trail_ids[shown:self._trail_shown]:
+            cmds.append(f"{w} itemconfigure {trail_id} -state hidden")
+        self._trail_shown = shown
+        if cmds:
+            canvas.tk.eval("\n".join(cmds))
         
         # Draw growing animation circle
         if self.show_grow_animation:
-            self.canvas.create_oval(
-                x - self.grow_radius, y - self.grow_radius,
-                x + self.grow_radius, y + self.grow_radius,
-                outline='#00d2d3', width=3, fill=''
-            )
+            self.draw_grow_circle()
+            canvas.itemconfigure(self._grow_id, state='normal')
+        else:
+            canvas.itemconfigure(self._grow_id, state='hidden')
             
         # Draw main red pointer circle
-        self.canvas.create_oval(
+        canvas.coords(
+            self._pointer_id,
             x - self.pointer_radius, y - self.pointer_radius,
-            x + self.pointer_radius, y + self.pointer_radius,
-            fill='#ff4757', outline='#ffffff', width=2
+            x + self.pointer_radius, y + self.pointer_radius
         )
+        canvas.itemconfigure(self._pointer_id, state='normal')
         
         # Draw crosshair
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width = canvas.winfo_width()
+        canvas_height = canvas.winfo_height()
         
         # Horizontal line
-        self.canvas.create_line(0, y, canvas_width, y, fill='#ff4757', width=1, stipple='gray50')
+        canvas.coords(self._crosshair_h, 0, y, canvas_width, y)
+        canvas.itemconfigure(self._crosshair_h, state='normal')
         # Vertical line
-        self.canvas.create_line(x, 0, x, canvas_height, fill='#ff4757', width=1, stipple='gray50')
-        
-        # Draw coordinates with modern styling
-        coord_text = f"Position: ({x}, {y})"
-        if self.trail_positions:
-            coord_text += f" | Trail: {len(self.trail_positions)}"
-        if self.history_count > 0:
-            coord_text += f" | Points: {self.history_count}"
-            
+        canvas.coords(self._crosshair_v, x, 0, x, canvas_height)
+        canvas.itemconfigure(self._crosshair_v, state='normal')
+        
         # Background for text
         text_x = x + 25
         text_y = y - 35
@@ -429,35 +524,65 @@ class ModernMouseTracker:
         if text_y < 20:
             text_y = y + 35
             
-        # Draw text background
-        self.canvas.create_rectangle(
-            text_x - 5, text_y - 15, text_x + 250, text_y + 15,
-            fill='#2b2b2b', outline='#ff4757', width=1
-        )
-        
-        # Draw text
-        self.canvas.create_text(
-            text_x, text_y, text=coord_text, anchor='w',
-            font=('Segoe UI', 11), fill='#ffffff'
-        )
+        # Text background
+        canvas.coords(self._text_bg_id, text_x - 5, text_y - 15, text_x + 250, text_y + 15)
+        
+        # Draw coordinates with modern styling, only reformatting when the numbers change
+        canvas.coords(self._text_id, text_x, text_y)
+        text_state = (x, y, len(self.trail_positions), self.history_count)
+        if text_state != self._last_text_state:
+            coord_text = self._coord_formats[text_state[2] > 0, text_state[3] > 0](*text_state)
+            if self._last_text_state is None:
+                canvas.itemconfigure(self._text_bg_id, state='normal')
+                canvas.itemconfigure(self._text_id, text=coord_text, state='normal')
+            else:
+                canvas.itemconfigure(self._text_id, text=coord_text)
+            self._last_text_state = text_state
         
         # Draw click effect if exists
         if hasattr(self, 'click_effect') and self.click_effect:
             effect = self.click_effect
-            self.canvas.create_oval(
+            canvas.coords(
+                self._click_id,
                 effect['x'] - effect['radius'], effect['y'] - effect['radius'],
-                effect['x'] + effect['radius'], effect['y'] + effect['radius'],
-                outline='#00d2d3', width=3, fill=''
+                effect['x'] + effect['radius'], effect['y'] + effect['radius']
             )
+            canvas.itemconfigure(self._click_id, state='normal')
             effect['radius'] += 3
             effect['lifetime'] -= 1
             if effect['lifetime'] <= 0:
                 del self.click_effect
+                self._dirty = True  # One more frame to hide it
+        else:
+            canvas.itemconfigure(self._click_id, state='hidden')
         
         # Keep UI elements on top
         self.reset_button.lift()
         self.controls_frame.lift()
         self.exit_button.lift()
+        self._last_drawn_xy = (x, y)
+        
+    def trail_style(self, alpha):
+        """Return the (radius, color) of a trail circle at fade level alpha"""
+        trail_radius = self.pointer_radius * (0.2 + 0.8 * alpha)
+        
+        # Create gradient colors from transparent to solid
+        if alpha < 0.3:
+            color = '#ffcccc'  # Very light red
+        elif alpha < 0.6:
+            color = '#ff8888'  # Medium red
+        else:
+            color = '#ff4444'  # Bright red
+        return trail_radius, color
+        
+    def draw_grow_circle(self):
+        """Move the growing animation circle to the current radius"""
+        x, y = self.current_x, self.current_y
+        self.canvas.coords(
+            self._grow_id,
+            x - self.grow_radius, y - self.grow_radius,
+            x + self.grow_radius, y + self.grow_radius
+        )
         
     def run(self):
         """Start the application"""
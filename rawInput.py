@@ -31,6 +31,8 @@ RIM_TYPEMOUSE = 0
 RIM_TYPEKEYBOARD = 1
 RIM_TYPEHID = 2
 
+RID_INPUT = 0x10000003
+
 # Raw Input Device Flags
 RIDEV_INPUTSINK = 0x00000100    # Receive input even when not in foreground
 RIDEV_NOLEGACY = 0x00000030     # Disable legacy mouse/keyboard messages
@@ -106,6 +108,17 @@ class RAWINPUT(ctypes.Structure):
         ("data", RAWINPUT_UNION)
     ]
 
+class RAWMOVEEVENT(ctypes.Structure):
+    """One mouse movement sample in the reader's shared movement ring"""
+    _fields_ = [
+        ("dx", ctypes.c_int32),
+        ("dy", ctypes.c_int32),
+        ("timestamp", ctypes.c_uint64)
+    ]
+
+# Header size passed to every GetRawInputData call, computed once
+RAWINPUTHEADER_SIZE = ctypes.sizeof(RAWINPUTHEADER)
+
 class MSG(ctypes.Structure):
     _fields_ = [
         ("hwnd", wintypes.HWND),
@@ -140,6 +153,13 @@ class RawInputReader:
         self.hid_data_count = 0
         self.raw_input_messages = 0
         
+        # Optional shared ring for mouse movement (see enable_move_ring)
+        self.move_ring = None
+        self.move_ring_size = 0
+        self.move_ring_head = 0     # Advanced only by the reader thread
+        self.move_ring_tail = 0     # Advanced only by the consumer
+        self.move_ring_dropped = 0
+        
         # Create a simple hidden window for message handling
         self.hwnd = self.create_message_window()
         
@@ -147,6 +167,21 @@ class RawInputReader:
         """Set callback function to handle raw input data"""
         self.callback = callback_func
         
+    def enable_move_ring(self, size=4096):
+        """
+        Publish mouse movement into a preallocated ctypes ring instead of the callback.
+        
+        The reader writes RAWMOVEEVENT entries and then advances move_ring_head;
+        a consumer reads entries from move_ring_tail up to move_ring_head (indices
+        modulo move_ring_size) and then advances move_ring_tail. Samples that
+        arrive while the ring is full are counted in move_ring_dropped.
+        """
+        self.move_ring = (RAWMOVEEVENT * size)()
+        self.move_ring_size = size
+        self.move_ring_head = 0
+        self.move_ring_tail = 0
+        self.move_ring_dropped = 0
+        
     def create_message_window(self):
         """Create a simple hidden window to receive raw input messages"""
         try:
@@ -309,10 +344,10 @@ class RawInputReader:
             size = wintypes.UINT()
             self.user32.GetRawInputData(
                 lParam, 
-                0x10000003,  # RID_INPUT
+                RID_INPUT,
                 None, 
                 ctypes.byref(size), 
-                ctypes.sizeof(RAWINPUTHEADER)
+                RAWINPUTHEADER_SIZE
             )
             
             if size.value == 0:
@@ -322,10 +357,10 @@ class RawInputReader:
             buffer = ctypes.create_string_buffer(size.value)
             result = self.user32.GetRawInputData(
                 lParam,
-                0x10000003,  # RID_INPUT
+                RID_INPUT,
                 buffer,
                 ctypes.byref(size),
-                ctypes.sizeof(RAWINPUTHEADER)
+                RAWINPUTHEADER_SIZE
             )
             
             if result != size.value:
@@ -352,18 +387,30 @@ class RawInputReader:
             self.total_mouse_x += mouse_data.lLastX
             self.total_mouse_y += mouse_data.lLastY
             
-            data = {
-                'type': 'mouse_move',
-                'delta_x': mouse_data.lLastX,
-                'delta_y': mouse_data.lLastY,
-                'total_x': self.total_mouse_x,
-                'total_y': self.total_mouse_y,
-                'flags': mouse_data.usFlags,
-                'timestamp': time.time()
-            }
-            
-            if self.callback:
-                self.callback(data)
+            if self.move_ring is not None:
+                # Write the sample into the ring, then publish it by advancing head
+                head = self.move_ring_head
+                if head - self.move_ring_tail < self.move_ring_size:
+                    event = self.move_ring[head % self.move_ring_size]
+                    event.dx = mouse_data.lLastX
+                    event.dy = mouse_data.lLastY
+                    event.timestamp = time.perf_counter_ns()
+                    self.move_ring_head = head + 1
+                else:
+                    self.move_ring_dropped += 1
+            else:
+                data = {
+                    'type': 'mouse_move',
+                    'delta_x': mouse_data.lLastX,
+                    'delta_y': mouse_data.lLastY,
+                    'total_x': self.total_mouse_x,
+                    'total_y': self.total_mouse_y,
+                    'flags': mouse_data.usFlags,
+                    'timestamp': time.time()
+                }
+                
+                if self.callback:
+                    self.callback(data)
                 
         # Mouse buttons
         button_flags = mouse_data.usButtonFlags
@@ -371,7 +418,7 @@ class RawInputReader:
             self.mouse_clicks += 1
             
             if button_flags & RI_MOUSE_WHEEL:
-                wheel_delta = ctypes.c_short(mouse_data.usButtonData).value
+                wheel_delta = (mouse_data.usButtonData ^ 0x8000) - 0x8000  # Sign-extend the 16-bit wheel delta
                 self.mouse_wheel_delta += wheel_delta
                 data = {
                     'type': 'mouse_wheel',
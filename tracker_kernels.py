@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Tracker Numeric Kernels
+=======================
+
+Hot numeric loops shared by the mouse trackers. When Numba is installed the
+kernels are JIT-compiled to native code (and cached on disk so only the very
+first run pays the compile cost); otherwise they run as plain Python.
+
+Kernels work on preallocated NumPy arrays and write their results in place,
+so the per-event and per-frame paths never allocate.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def find_collisions(pins_x, pins_y, cell_order, cell_start, grid_w, grid_h, cell,
+                    x, y, reach, d2_thresh, out_idx):
+    """Write indices of pins within sqrt(d2_thresh) of (x, y) to out_idx, return the count
+
+    Pins are bucketed in a CSR grid: the pins of cell (gx, gy) are
+    cell_order[cell_start[k]:cell_start[k + 1]] with k = gy * grid_w + gx. Cells
+    are at least 2 * reach wide, so only the 2x2 block nearest (x, y) is scanned.
+    """
+    cx = int(x // cell)
+    cy = int(y // cell)
+    nx = cx - 1 if x - cx * cell < reach else cx + 1
+    ny = cy - 1 if y - cy * cell < reach else cy + 1
+    count = 0
+    for gy in (cy, ny):
+        if gy < 0 or gy >= grid_h:
+            continue
+        for gx in (cx, nx):
+            if gx < 0 or gx >= grid_w:
+                continue
+            k = gy * grid_w + gx
+            for j in range(cell_start[k], cell_start[k + 1]):
+                idx = cell_order[j]
+                dx = pins_x[idx] - x
+                dy = pins_y[idx] - y
+                if dx * dx + dy * dy <= d2_thresh:
+                    out_idx[count] = idx
+                    count += 1
+    return count
+
+
+@njit(cache=True)
+def step_bounces(xs, ys, starts, durations, max_radii, radii, color_intensity,
+                 velocities, pin_index, count, now, pin_radius):
+    """Advance bounce effects to time `now` (integer ns), compacting expired ones out in place; return the live count"""
+    alive = 0
+    for i in range(count):
+        progress = (now - starts[i]) / durations[i]
+        if progress > 1.0:
+            continue
+        xs[alive] = xs[i]
+        ys[alive] = ys[i]
+        starts[alive] = starts[i]
+        durations[alive] = durations[i]
+        max_radii[alive] = max_radii[i]
+        velocities[alive] = velocities[i]
+        pin_index[alive] = pin_index[i]
+        radii[alive] = pin_radius + (max_radii[i] - pin_radius) * progress
+        color_intensity[alive] = int(color_intensity[i] * (1.0 - progress))
+        alive += 1
+    return alive
+
+
+@njit(cache=True)
+def spawn_bounces(hit_idx, hits, pins_x, pins_y, velocity, now, xs, ys, starts, durations,
+                  max_radii, radii, color_intensity, velocities, pin_index, count,
+                  pin_radius, dedup_ns, dur_base_ns, dur_scale_ns):
+    """Start a bounce effect on each hit pin with no recent effect nearby; return the new live count"""
+    velocity_factor = min(velocity / 50.0, 3.0)  # Cap at 3x effect
+    intensity = min(255, 150 + int(velocity * 2))
+    duration = dur_base_ns + int(velocity_factor * dur_scale_ns)
+    for h in range(hits):
+        if count >= xs.shape[0]:
+            break
+        idx = hit_idx[h]
+        px = pins_x[idx]
+        py = pins_y[idx]
+        recent = False
+        for i in range(count):
+            if abs(xs[i] - px) < 10 and abs(ys[i] - py) < 10 and now - starts[i] < dedup_ns:
+                recent = True
+                break
+        if recent:
+            continue
+        xs[count] = px
+        ys[count] = py
+        radii[count] = pin_radius
+        max_radii[count] = pin_radius * (2 + velocity_factor)
+        starts[count] = now
+        durations[count] = duration
+        color_intensity[count] = intensity
+        velocities[count] = velocity
+        pin_index[count] = idx
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def bounce_colors(velocities, color_intensity, count, out_rgb, out_rings):
+    """Write each live bounce effect's RGB channels and concentric ring count into the out arrays"""
+    for i in range(count):
+        velocity_factor = min(velocities[i] / 30.0, 2.0)
+        out_rgb[i, 0] = min(255, color_intensity[i] + int(velocity_factor * 50))
+        out_rgb[i, 1] = max(0, color_intensity[i] - int(velocity_factor * 25))
+        out_rgb[i, 2] = int(velocity_factor * 100)
+        out_rings[i] = int(1 + velocity_factor)
+
+
+@njit(cache=True)
+def trail_sprites(trail_x, trail_y, trail_v, order, count, pointer_radius,
+                  alpha_scale, velocity_scale, out_boxes, out_buckets):
+    """Write each trail point's oval bounds and (alpha, velocity) color bucket, oldest first"""
+    for i in range(count):
+        idx = order[i]
+        alpha = (i + 1) / count
+        velocity_factor = min(trail_v[idx] / 30.0, 1.0)
+
+        # Radius varies with velocity
+        radius = pointer_radius * (0.2 + 0.8 * alpha) * (1 + velocity_factor * 0.5)
+        out_boxes[i, 0] = trail_x[idx] - radius
+        out_boxes[i, 1] = trail_y[idx] - radius
+        out_boxes[i, 2] = trail_x[idx] + radius
+        out_boxes[i, 3] = trail_y[idx] + radius
+        out_buckets[i, 0] = int(alpha * alpha_scale + 0.5)
+        out_buckets[i, 1] = int(velocity_factor * velocity_scale + 0.5)
+
+
+@njit(cache=True)
+def trail_fans(trail_xy, count, ring, base_radius, out_verts, out_idx):
+    """Tessellate trail points into triangle fans with a per-vertex fade alpha, oldest first
+
+    Point i gets alpha (i + 1) / count and radius base_radius * (0.3 + 0.7 * alpha).
+    Vertices are interleaved (x, y, alpha), one center plus len(ring) rim vertices
+    per point, and indices address the whole batch so it draws as a single Mesh.
+    """
+    segments = ring.shape[0]
+    fan_size = segments + 1
+    for i in range(count):
+        alpha = (i + 1) / count
+        radius = base_radius * (0.3 + 0.7 * alpha)
+        x = trail_xy[i, 0]
+        y = trail_xy[i, 1]
+
+        # Center vertex followed by the ring
+        v = i * fan_size * 3
+        out_verts[v] = x
+        out_verts[v + 1] = y
+        out_verts[v + 2] = alpha
+        for s in range(segments):
+            v += 3
+            out_verts[v] = x + ring[s, 0] * radius
+            out_verts[v + 1] = y + ring[s, 1] * radius
+            out_verts[v + 2] = alpha
+
+        j = i * segments * 3
+        base = i * fan_size
+        for s in range(segments):
+            out_idx[j] = base
+            out_idx[j + 1] = base + 1 + s
+            out_idx[j + 2] = base + 1 + (s + 1) % segments
+            j += 3
+
+
+@njit(cache=True)
+def history_groups(count, band_size, out_bounds, out_intensity, out_width):
+    """Group the segments of a count-point history into runs of equal intensity band and width; return the group count
+
+    Segment i joins points i and i + 1 and has alpha (i + 1) / count, intensity
+    100 + 155 * alpha and width max(1, 3 * alpha). Group g spans segments
+    out_bounds[g] to out_bounds[g + 1] - 1 and is styled by its middle segment.
+    """
+    max_groups = out_width.shape[0]
+    groups = 0
+    last_key = -1
+    for i in range(count - 1):
+        alpha = (i + 1) / count
+        key = (int(100 + 155 * alpha) // band_size) * 4 + max(1, int(3 * alpha))
+        if key != last_key and groups < max_groups:
+            out_bounds[groups] = i
+            groups += 1
+            last_key = key
+    out_bounds[groups] = count - 1
+
+    for g in range(groups):
+        alpha = ((out_bounds[g] + out_bounds[g + 1] - 1) // 2 + 1) / count
+        out_intensity[g] = int(100 + 155 * alpha)
+        out_width[g] = max(1, int(3 * alpha))
+    return groups
+
+
+# Raw mouse stats slots updated by update_mouse, and the event kind bits it returns
+MOUSE_TOTAL_X, MOUSE_TOTAL_Y, MOUSE_CLICKS, MOUSE_WHEEL_TOTAL, MOUSE_LAST_FLAGS = range(5)
+MOUSE_EVENT_MOVE = 1
+MOUSE_EVENT_WHEEL = 2
+MOUSE_EVENT_BUTTON = 4
+
+
+@njit(cache=True)
+def update_mouse(stats, dx, dy, button_flags, button_data):
+    """Fold one raw mouse event into stats in place; return (event kind bits, wheel delta, button bit index or -1)"""
+    kind = 0
+    wheel = 0
+    button = -1
+    if dx != 0 or dy != 0:
+        stats[MOUSE_TOTAL_X] += dx
+        stats[MOUSE_TOTAL_Y] += dy
+        kind |= MOUSE_EVENT_MOVE
+    if button_flags:
+        stats[MOUSE_CLICKS] += 1
+        if button_flags & 0x0400 and not button_flags & 0x003F:
+            wheel = (button_data ^ 0x8000) - 0x8000  # Sign-extend the 16-bit wheel delta
+            stats[MOUSE_WHEEL_TOTAL] += wheel
+            kind |= MOUSE_EVENT_WHEEL
+        else:
+            # Lowest set transition bit wins (left down, left up, right down, ...)
+            for i in range(6):
+                if button_flags & (1 << i):
+                    button = i
+                    break
+            kind |= MOUSE_EVENT_BUTTON
+    stats[MOUSE_LAST_FLAGS] = button_flags
+    return kind, wheel, button